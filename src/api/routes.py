@@ -6,11 +6,10 @@ validation, and proper response formatting. Includes both
 JSON and CSV processing endpoints with detailed logging.
 """
 
-import io
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import Response, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError as PydanticValidationError
@@ -36,6 +35,7 @@ app = FastAPI(
     title=API_TITLE,
     version=API_VERSION,
     description=API_DESCRIPTION,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -200,7 +200,7 @@ async def process_single_risk(request: RiskDataInput) -> RiskProcessingResponse:
     component breakdowns, and error tracking.
     """
 )
-async def process_csv_upload(file: UploadFile = File(...)) -> StreamingResponse:
+async def process_csv_upload(file: UploadFile = File(...)) -> Response:
     """
     Process CSV file upload with concurrent processing.
     
@@ -208,7 +208,7 @@ async def process_csv_upload(file: UploadFile = File(...)) -> StreamingResponse:
         file: Uploaded CSV file
         
     Returns:
-        StreamingResponse with processed CSV content
+        Response with processed CSV content
         
     Raises:
         HTTPException: 400 for file/structure errors, 500 for processing errors
@@ -251,11 +251,9 @@ async def process_csv_upload(file: UploadFile = File(...)) -> StreamingResponse:
         # Process CSV with the CSV processor
         result_df = csv_processor.process_csv_file(content_str, file.filename)
         
-        # Convert result to CSV string
-        output_buffer = io.StringIO()
-        result_df.to_csv(output_buffer, index=False)
-        output_buffer.seek(0)
-        csv_content = output_buffer.getvalue()
+        # Serialize result straight to UTF-8 bytes (single copy, no re-buffering);
+        # NaN scores on error rows are written as blank cells
+        csv_bytes = result_df.to_csv(index=False, na_rep='').encode('utf-8')
         
         # Create filename for download
         original_name = file.filename.rsplit('.', 1)[0] if '.' in file.filename else file.filename
@@ -267,9 +265,9 @@ async def process_csv_upload(file: UploadFile = File(...)) -> StreamingResponse:
             "total_rows": len(result_df)
         })
         
-        # Return CSV as streaming response
-        return StreamingResponse(
-            io.BytesIO(csv_content.encode('utf-8')),
+        # Return CSV body in one chunk; a BytesIO stream would be sent line by line
+        return Response(
+            content=csv_bytes,
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename={download_filename}"
@@ -428,7 +426,7 @@ async def root():
 @app.options("/")
 async def root_options():
     """Handle OPTIONS request for root endpoint."""
-    response = JSONResponse(content={"message": "OK"})
+    response = ORJSONResponse(content={"message": "OK"})
     response.headers["Access-Control-Allow-Origin"] = "*"
     response.headers["Access-Control-Allow-Methods"] = "GET, POST, OPTIONS"
     response.headers["Access-Control-Allow-Headers"] = "*"
@@ -440,7 +438,7 @@ async def root_options():
 async def validation_exception_handler(request, exc: ValidationError):
     """Handle custom validation errors."""
     logger.log_error(f"Validation error: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"detail": str(exc)}
     )
@@ -470,7 +468,7 @@ async def request_validation_exception_handler(request, exc: RequestValidationEr
                 error_details.append(f"{field}: {error['msg']}")
         else:
             # Other validation errors - keep as 422
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=422,
                 content={"detail": exc.errors()}
             )
@@ -478,7 +476,7 @@ async def request_validation_exception_handler(request, exc: RequestValidationEr
     error_message = "; ".join(error_details)
     logger.log_error(f"Request validation error (converted to 400): {error_message}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"detail": error_message}
     )
@@ -513,7 +511,7 @@ async def pydantic_validation_exception_handler(request, exc: PydanticValidation
     error_message = "; ".join(error_details)
     logger.log_error(f"Pydantic validation error: {error_message}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={"detail": error_message}
     )
@@ -523,7 +521,7 @@ async def pydantic_validation_exception_handler(request, exc: PydanticValidation
 async def internal_server_error_handler(request, exc):
     """Handle internal server errors."""
     logger.log_error("Internal server error occurred", exc)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
\ No newline at end of file
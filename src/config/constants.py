@@ -51,8 +51,11 @@ DEFAULT_RULES: List[Dict] = [
 
 # Risk Processing Configuration
 DEFAULT_NOISE_LEVEL: float = 0.05  # Set to 0.0 for deterministic tests
+NOISE_BUFFER_SIZE: int = 1024  # Uniform draws pre-generated per refill for single-record noise
 OUTPUT_SCALE: int = 100  # Final risk score scale (0-100)
 REJECT_UNKNOWN_WEATHER: bool = True  # Strict weather validation
+DEDUP_MAX_UNIQUE_RATIO: float = 0.8  # Batch scoring dedups repeated inputs below this unique ratio
+RISK_STREAM_CHUNK_SIZE: int = 4096  # Records scored per chunk by process_risk_stream
 
 # Input Validation Ranges
 CRIME_RANGE: Tuple[int, int] = (0, 10)
@@ -80,8 +83,11 @@ CSV_OUTPUT_COLUMNS: List[str] = [
 ]
 
 # CSV Processing Performance Settings
-CSV_MAX_WORKERS: int = 8  # ThreadPoolExecutor worker count
-CSV_CHUNK_SIZE: int = 20000  # Rows per processing chunk
+CSV_MAX_WORKERS: int = 8  # ThreadPoolExecutor worker count (capped at CPU count)
+CSV_CHUNK_SIZE: int = 20000  # Rows per vectorized processing chunk
+CSV_STREAM_CHUNK_SIZE: int = 100000  # Rows read at a time by process_csv_stream
+PARALLEL_KERNEL_MIN_RECORDS: int = 10000  # Smaller batches use the single-threaded Numba kernel
+NUMBA_THREADS_ENV_VAR: str = "RISKSIGHT_NUMBA_THREADS"  # Optional cap on Numba kernel threads
 
 # Logging Configuration
 GENERAL_LOG_PATH: str = "logs/general.log"
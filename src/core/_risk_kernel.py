@@ -0,0 +1,211 @@
+"""
+Compiled numeric kernels for batch risk scoring.
+
+Provides Numba-compiled versions of the deterministic scoring pipeline used
+by RiskProcessor.process_risk_arrays. Numba is optional: when it is not
+installed, NUMBA_AVAILABLE is False and the kernels are None, and callers
+use the NumPy implementation instead.
+
+The worker thread count for the parallel kernel can be capped with the
+RISKSIGHT_NUMBA_THREADS environment variable. One Python thread at a time
+runs the parallel kernel; concurrent callers use the serial kernel.
+"""
+
+import os
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.config.constants import NUMBA_THREADS_ENV_VAR, PARALLEL_KERNEL_MIN_RECORDS
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional
+    NUMBA_AVAILABLE = False
+
+
+# Rule condition operator codes for numeric fields
+OP_NONE = 0
+OP_GREATER = 1
+OP_LESS = 2
+OP_EQUAL = 3
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _score_record(i, crime_index, accident_rate, socioeconomic_level, weather_idx,
+                      weights, weather_lut, rule_multipliers, rule_weather_masks,
+                      rule_ops, rule_thresholds, output_scale, risk_score, crime_component,
+                      accident_component, socio_component, weather_component):
+        """
+        Score record i and write its results into the output arrays.
+
+        Follows the same operation order as the per-record pipeline so the
+        results match it exactly (no fastmath reassociation).
+        """
+        values = (crime_index[i], accident_rate[i], socioeconomic_level[i])
+        crime = values[0] / 10.0
+        accident = values[1] / 10.0
+        socio = (11 - values[2]) / 9.0
+        weather = weather_lut[weather_idx[i]]
+
+        score = crime * weights[0] + accident * weights[1] + socio * weights[2] + weather * weights[3]
+        score = max(0.0, min(1.0, score))
+
+        for rule in range(rule_multipliers.shape[0]):
+            matched = (rule_weather_masks[rule] >> weather_idx[i]) & 1 == 1
+            for field in range(3):
+                op = rule_ops[rule, field]
+                threshold = rule_thresholds[rule, field]
+                if op == OP_GREATER:
+                    matched = matched and values[field] > threshold
+                elif op == OP_LESS:
+                    matched = matched and values[field] < threshold
+                elif op == OP_EQUAL:
+                    matched = matched and values[field] == threshold
+            if matched:
+                score *= rule_multipliers[rule]
+
+        risk_score[i] = min(max(score * output_scale, 0.0), output_scale)
+        crime_component[i] = min(max(crime * output_scale, 0.0), output_scale)
+        accident_component[i] = min(max(accident * output_scale, 0.0), output_scale)
+        socio_component[i] = min(max(socio * output_scale, 0.0), output_scale)
+        weather_component[i] = min(max(weather * output_scale, 0.0), output_scale)
+
+    @njit(parallel=True, cache=True)
+    def compute_scores_kernel(crime_index, accident_rate, socioeconomic_level, weather_idx,
+                              weights, weather_lut, rule_multipliers, rule_weather_masks,
+                              rule_ops, rule_thresholds, output_scale):
+        """
+        Compute scaled risk scores and components for validated records.
+
+        Records are split across Numba's worker threads.
+
+        Args:
+            crime_index: Crime index values (float64)
+            accident_rate: Accident rate values (float64)
+            socioeconomic_level: Socioeconomic level values (float64)
+            weather_idx: Weather category indices into weather_lut (int64)
+            weights: Component weights in crime/accident/socio/weather order
+            weather_lut: Weather component score per category index (0-1 scale)
+            rule_multipliers: Multiplier per amplification rule
+            rule_weather_masks: Bitmask of matching weather indices per rule
+            rule_ops: Operator code per rule and numeric field, shape (rules, 3)
+            rule_thresholds: Threshold per rule and numeric field, shape (rules, 3)
+            output_scale: Final score scale
+
+        Returns:
+            Tuple of unrounded (risk_score, crime, accident, socioeconomic,
+            weather) arrays on the output scale
+        """
+        record_count = crime_index.shape[0]
+        outputs = (np.empty(record_count), np.empty(record_count), np.empty(record_count),
+                   np.empty(record_count), np.empty(record_count))
+
+        for i in prange(record_count):
+            _score_record(i, crime_index, accident_rate, socioeconomic_level, weather_idx,
+                          weights, weather_lut, rule_multipliers, rule_weather_masks,
+                          rule_ops, rule_thresholds, output_scale, *outputs)
+
+        return outputs
+
+    @njit(cache=True)
+    def compute_scores_kernel_serial(crime_index, accident_rate, socioeconomic_level, weather_idx,
+                                     weights, weather_lut, rule_multipliers, rule_weather_masks,
+                                     rule_ops, rule_thresholds, output_scale):
+        """
+        Single-threaded compute_scores_kernel for batches too small to split.
+
+        Takes the same arguments and returns the same arrays.
+        """
+        record_count = crime_index.shape[0]
+        outputs = (np.empty(record_count), np.empty(record_count), np.empty(record_count),
+                   np.empty(record_count), np.empty(record_count))
+
+        for i in range(record_count):
+            _score_record(i, crime_index, accident_rate, socioeconomic_level, weather_idx,
+                          weights, weather_lut, rule_multipliers, rule_weather_masks,
+                          rule_ops, rule_thresholds, output_scale, *outputs)
+
+        return outputs
+
+else:
+    compute_scores_kernel = None
+    compute_scores_kernel_serial = None
+
+
+def _configured_thread_count() -> Optional[int]:
+    """
+    Read the parallel kernel thread count from the environment.
+
+    Returns:
+        Thread count capped at Numba's pool size, or None to use Numba's
+        default (also for unset or invalid values)
+    """
+    value = os.environ.get(NUMBA_THREADS_ENV_VAR)
+    if not NUMBA_AVAILABLE or not value:
+        return None
+
+    try:
+        threads = int(value)
+    except ValueError:
+        threads = 0
+    if threads < 1:
+        print(f"Warning: ignoring {NUMBA_THREADS_ENV_VAR}={value!r}, expected a positive integer")
+        return None
+
+    return min(threads, numba.config.NUMBA_NUM_THREADS)
+
+
+KERNEL_THREADS = _configured_thread_count()
+
+# Held while the parallel kernel runs: Numba's workqueue threading layer
+# aborts the process when parallel regions are launched from two threads
+_parallel_kernel_lock = threading.Lock()
+
+
+def _run_parallel_kernel(*args):
+    """
+    Run compute_scores_kernel, or the serial kernel if another thread is in it.
+
+    Args:
+        *args: Kernel arguments
+
+    Returns:
+        Kernel output arrays
+    """
+    if not _parallel_kernel_lock.acquire(blocking=False):
+        return compute_scores_kernel_serial(*args)
+    try:
+        if KERNEL_THREADS is not None:
+            numba.set_num_threads(KERNEL_THREADS)
+        return compute_scores_kernel(*args)
+    finally:
+        _parallel_kernel_lock.release()
+
+
+def select_scores_kernel(record_count: int) -> Optional[Callable]:
+    """
+    Choose the scoring kernel for a batch of the given size.
+
+    Batches up to PARALLEL_KERNEL_MIN_RECORDS run single-threaded, where
+    splitting work across threads costs more than it saves. Larger batches
+    get the parallel kernel, which falls back to the serial one while
+    another thread is running it. Numba thread counts are per calling
+    thread, so KERNEL_THREADS is applied on every parallel call.
+
+    Args:
+        record_count: Number of records to score
+
+    Returns:
+        Kernel function, or None if Numba is not installed
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    if record_count <= PARALLEL_KERNEL_MIN_RECORDS:
+        return compute_scores_kernel_serial
+    return _run_parallel_kernel
@@ -11,6 +11,9 @@ from src.config.constants import (
     WEATHER_CATEGORIES, CRIME_RANGE, ACCIDENT_RANGE, SOCIO_RANGE
 )
 
+# Case-insensitive weather lookup, built once at import
+_WEATHER_BY_LOWER = {key.lower(): key for key in WEATHER_CATEGORIES}
+
 
 class RiskDataInput(BaseModel):
     """
@@ -55,17 +58,14 @@ class RiskDataInput(BaseModel):
     @validator('weather')
     def validate_weather_category(cls, v:str):
         """Validate weather category against allowed values (case-insensitive)."""
-        # Create case-insensitive mapping for weather categories
-        weather_mapping = {key.lower(): key for key in WEATHER_CATEGORIES.keys()}
-        
         # Convert input to lowercase for comparison
         v_lower = v.lower()
         
-        if v_lower not in weather_mapping:
+        if v_lower not in _WEATHER_BY_LOWER:
             raise ValueError(f"Unknown weather: {v}")
             
         # Return the properly formatted weather value
-        return weather_mapping[v_lower]
+        return _WEATHER_BY_LOWER[v_lower]
     
     @validator('city')
     def validate_city_name(cls, v):
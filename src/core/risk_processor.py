@@ -6,14 +6,122 @@ applying transformations, calculating component scores, and generating
 final aggregated risk scores with configurable rules and weights.
 """
 
-import random
-from typing import Dict, List, Optional, Any, Union
+import itertools
+import operator
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Any, Tuple, Union
+import numpy as np
+import pandas as pd
 from src.core.validators import RiskDataValidator, ValidationError
+from src.core._risk_kernel import (
+    NUMBA_AVAILABLE, OP_NONE, OP_GREATER, OP_LESS, OP_EQUAL, select_scores_kernel
+)
 from src.config.constants import (
     DEFAULT_WEIGHTS, DEFAULT_RULES, WEATHER_CATEGORIES,
-    DEFAULT_NOISE_LEVEL, OUTPUT_SCALE
+    DEFAULT_NOISE_LEVEL, OUTPUT_SCALE, DEDUP_MAX_UNIQUE_RATIO, NOISE_BUFFER_SIZE,
+    RISK_STREAM_CHUNK_SIZE
 )
 
+# Component order shared by the array and compiled kernel paths
+_COMPONENT_FIELDS = ("crime_index", "accident_rate", "socioeconomic_level", "weather")
+_NUMERIC_FIELDS = _COMPONENT_FIELDS[:3]
+
+# Score keys of process_risk_data output, in result order
+_RESULT_KEYS = ("risk_score",) + tuple(f"{field}_component" for field in _COMPONENT_FIELDS)
+
+# Comparison operators accepted in string rule conditions (">7", "<3", "=5")
+_CONDITION_OPERATORS = {">": operator.gt, "<": operator.lt, "=": operator.eq}
+
+# Bound on cached compiled rule conditions per processor
+_MAX_COMPILED_CONDITIONS = 1024
+
+
+def _is_member(value: Any, members: Any) -> bool:
+    """Set membership check of a compiled rule condition."""
+    return value in members
+
+
+def _equals(value: Any, expected: Any) -> bool:
+    """Direct value check of a compiled rule condition."""
+    return not (value != expected)
+
+
+def _round_scores(values: np.ndarray) -> np.ndarray:
+    """
+    Round scores to 2 decimals exactly like the built-in round().
+    
+    np.round scales by 100 before rounding, which can resolve near-halfway
+    values differently from round(); those few values are re-rounded
+    individually so array and per-record results always agree.
+    
+    Args:
+        values: Score values
+        
+    Returns:
+        Rounded score values
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100.0
+    near_half = np.flatnonzero(np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6)
+    if near_half.size:
+        rounded[near_half] = [round(value, 2) for value in values[near_half].tolist()]
+    return rounded
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class RiskResult(Mapping):
+    """
+    Result of processing a single risk record (scores on the 0-100 scale).
+
+    A read-only Mapping over the keys of the former dict output, with city
+    present only if one was provided, so callers written against that dict
+    keep working (result["risk_score"], "city" in result, result.items(),
+    dict(result), comparison with a dict). as_dict() returns the dict.
+    """
+    risk_score: float
+    crime_index_component: float
+    accident_rate_component: float
+    socioeconomic_level_component: float
+    weather_component: float
+    city: Optional[str] = None
+
+    def __getitem__(self, key: str) -> Union[float, str]:
+        """
+        Return a score or the city by its former dictionary key.
+        """
+        if key in _RESULT_FIELDS and (key != "city" or self.city is not None):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _RESULT_KEYS
+        if self.city is not None:
+            yield "city"
+
+    def __len__(self) -> int:
+        return len(_RESULT_KEYS) + (self.city is not None)
+
+    def as_dict(self) -> Dict[str, Union[float, str]]:
+        """
+        Convert to the dictionary format returned before RiskResult.
+
+        Returns:
+            Dictionary of scores, with city only if one was provided
+        """
+        result = {
+            "risk_score": self.risk_score,
+            "crime_index_component": self.crime_index_component,
+            "accident_rate_component": self.accident_rate_component,
+            "socioeconomic_level_component": self.socioeconomic_level_component,
+            "weather_component": self.weather_component,
+        }
+        if self.city is not None:
+            result["city"] = self.city
+        return result
+
+
+_RESULT_FIELDS = frozenset(RiskResult.__dataclass_fields__)
+
 
 class RiskProcessor:
     """
@@ -45,13 +153,18 @@ class RiskProcessor:
         self.noise_level = noise_level
         self.weather_categories = WEATHER_CATEGORIES
         self.validator = RiskDataValidator()
+        self._compiled_conditions = {}
+        
+        # Noise source; single records consume pre-drawn uniform values
+        self._rng = np.random.default_rng()
+        self._uniform_buffer = []
         
         # Validate weights sum to reasonable value
         total_weight = sum(self.weights.values())
         if abs(total_weight - 1.0) > 0.01:
             print(f"Warning: Component weights sum to {total_weight}, not 1.0")
     
-    def process_risk_data(self, raw_data: Dict[str, Any]) -> Dict[str, Union[float, str]]:
+    def process_risk_data(self, raw_data: Dict[str, Any]) -> RiskResult:
         """
         Process raw risk indicators into normalized risk score.
         
@@ -62,7 +175,7 @@ class RiskProcessor:
             raw_data: Dictionary containing raw risk indicators
             
         Returns:
-            Dictionary with final risk_score and component breakdown
+            RiskResult with final risk_score and component breakdown
             
         Raises:
             ValidationError: If input validation fails
@@ -72,22 +185,7 @@ class RiskProcessor:
             # Stage 1: Validate and clean inputs
             validated_data = self.validator.validate_risk_data(raw_data)
             
-            # Stage 2: Calculate normalized component scores (0-1 scale)
-            components = self._calculate_component_scores(validated_data)
-            
-            # Stage 3: Apply weighted aggregation
-            base_score = self._calculate_weighted_score(components)
-            
-            # Stage 4: Apply amplification rules
-            amplified_score = self._apply_amplification_rules(base_score, validated_data)
-            
-            # Stage 5: Add statistical noise (if configured)
-            noisy_score = self._add_statistical_noise(amplified_score)
-            
-            # Stage 6: Scale to output range and prepare final result
-            final_result = self._prepare_final_result(noisy_score, components, validated_data)
-            
-            return final_result
+            return self._process_validated_data(validated_data)
             
         except ValidationError:
             # Re-raise validation errors as-is for proper error handling
@@ -96,6 +194,444 @@ class RiskProcessor:
             # Wrap unexpected errors
             raise ValueError(f"Risk processing failed: {str(e)}")
     
+    def process_risk_data_trusted(self, data: Dict[str, Any]) -> RiskResult:
+        """
+        Process risk indicators that are already validated, skipping stage 1.
+        
+        For pipelines whose records come from RiskDataValidator (or were
+        produced to the same contract): numeric indicators within range and
+        a known, stripped weather category. Out-of-contract input gives
+        undefined scores rather than validation messages.
+        
+        Args:
+            data: Validated input data, as returned by validate_risk_data
+            
+        Returns:
+            RiskResult with final risk_score and component breakdown
+            
+        Raises:
+            ValidationError: If the weather category is unknown
+            ValueError: If processing encounters invalid data
+        """
+        try:
+            return self._process_validated_data(data)
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Risk processing failed: {str(e)}")
+    
+    def _process_validated_data(self, validated_data: Dict[str, Any]) -> RiskResult:
+        """
+        Run pipeline stages 2-6 on validated input data.
+        
+        Args:
+            validated_data: Validated input data
+            
+        Returns:
+            RiskResult with final risk_score and component breakdown
+        """
+        # Stage 2: Calculate normalized component scores (0-1 scale)
+        components = self._calculate_component_scores(validated_data)
+        
+        # Stage 3: Apply weighted aggregation
+        base_score = self._calculate_weighted_score(components)
+        
+        # Stage 4: Apply amplification rules
+        amplified_score = self._apply_amplification_rules(base_score, validated_data)
+        
+        # Stage 5: Add statistical noise (if configured)
+        noisy_score = self._add_statistical_noise(amplified_score)
+        
+        # Stage 6: Scale to output range and prepare final result
+        return self._prepare_final_result(noisy_score, components, validated_data)
+    
+    def process_risk_batch(self, records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Process many raw risk records with one vectorized scoring pass.
+        
+        Records are validated one by one exactly as in process_risk_data,
+        then scored together as parallel arrays (one per indicator). Noise,
+        if enabled, is drawn for all records in one generator call. With
+        rules the array pipeline cannot evaluate, each record goes through
+        process_risk_data instead.
+        
+        Args:
+            records: List of raw input dictionaries
+            
+        Returns:
+            Dictionary of score arrays keyed like process_risk_data output
+            (risk_score and the four component scores)
+            
+        Raises:
+            ValidationError: If a record fails validation (message prefixed
+                with its position in the list)
+        """
+        return self._process_batch(records, 0)
+    
+    def process_risk_stream(self,
+                            records: Iterable[Dict[str, Any]],
+                            chunk_size: int = RISK_STREAM_CHUNK_SIZE) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Process an iterable of raw risk records in fixed-size chunks.
+        
+        Each chunk is scored like process_risk_batch, so memory stays
+        bounded by the chunk size however long the input is.
+        
+        Args:
+            records: Iterable of raw input dictionaries (consumed lazily)
+            chunk_size: Records per chunk
+            
+        Yields:
+            Dictionary of score arrays per chunk, keyed like
+            process_risk_batch output
+            
+        Raises:
+            ValueError: If chunk_size is not positive
+            ValidationError: If a record fails validation (message prefixed
+                with its position in the stream)
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        
+        records = iter(records)
+        position = 0
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                return
+            yield self._process_batch(chunk, position)
+            position += len(chunk)
+    
+    def _process_batch(self, records: List[Dict[str, Any]], first_position: int) -> Dict[str, np.ndarray]:
+        """
+        Score a list of raw records (see process_risk_batch).
+        
+        Args:
+            records: List of raw input dictionaries
+            first_position: Position of the first record, for error messages
+            
+        Returns:
+            Dictionary of score arrays keyed like process_risk_data output
+        """
+        vectorized_noise = (
+            self.noise_level == 0.0
+            or type(self)._add_statistical_noise is RiskProcessor._add_statistical_noise
+        )
+        if (not self._array_rules_supported() or not vectorized_noise
+                or not self.validator.reject_unknown_weather):
+            results = []
+            for position, record in enumerate(records):
+                try:
+                    results.append(self.process_risk_data(record))
+                except ValidationError as e:
+                    raise ValidationError(f"Record {first_position + position}: {str(e)}")
+            return {
+                key: np.array([result[key] for result in results], dtype=np.float64)
+                for key in _RESULT_KEYS
+            }
+        
+        record_count = len(records)
+        columns = {field: np.empty(record_count, dtype=np.float64) for field in _NUMERIC_FIELDS}
+        weather = np.empty(record_count, dtype=object)
+        
+        for position, record in enumerate(records):
+            try:
+                validated = self.validator.validate_risk_data(record)
+            except ValidationError as e:
+                raise ValidationError(f"Record {first_position + position}: {str(e)}")
+            for field, values in columns.items():
+                values[position] = validated[field]
+            weather[position] = validated["weather"]
+        
+        noise = None
+        if self.noise_level != 0.0:
+            noise = self._rng.uniform(-self.noise_level, self.noise_level, size=record_count)
+        
+        return self._process_arrays(
+            columns["crime_index"], columns["accident_rate"], columns["socioeconomic_level"], weather, noise
+        )
+    
+    def process_risk_arrays(self,
+                            crime_index: np.ndarray,
+                            accident_rate: np.ndarray,
+                            socioeconomic_level: np.ndarray,
+                            weather: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Process pre-validated risk indicators for many records at once.
+        
+        Vectorized equivalent of the deterministic process_risk_data pipeline:
+        each stage operates on whole NumPy columns instead of one record.
+        Statistical noise is not applied; check supports_array_processing()
+        before choosing this path over per-record processing.
+        
+        Args:
+            crime_index: Validated crime index values
+            accident_rate: Validated accident rate values
+            socioeconomic_level: Validated socioeconomic level values
+            weather: Validated weather category names, or a pd.Categorical
+                over the weather categories
+            
+        Returns:
+            Dictionary of result arrays keyed like process_risk_data output
+            
+        Raises:
+            ValueError: If a weather value is not a known category
+        """
+        return self._process_arrays(crime_index, accident_rate, socioeconomic_level, weather)
+    
+    def _process_arrays(self,
+                        crime_index: np.ndarray,
+                        accident_rate: np.ndarray,
+                        socioeconomic_level: np.ndarray,
+                        weather: np.ndarray,
+                        noise: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Score validated arrays, optionally adding per-record noise.
+        
+        Args:
+            crime_index: Validated crime index values
+            accident_rate: Validated accident rate values
+            socioeconomic_level: Validated socioeconomic level values
+            weather: Validated weather category names or pd.Categorical
+            noise: Noise per record added to the amplified 0-1 score, or
+                None for deterministic scoring
+            
+        Returns:
+            Dictionary of result arrays keyed like process_risk_data output
+            
+        Raises:
+            ValueError: If a weather value is not a known category
+        """
+        # Weather as integer category codes; a Categorical with matching
+        # categories is reused without re-hashing its strings
+        categorical = pd.Categorical(weather, categories=list(self.weather_categories))
+        weather_idx = categorical.codes.astype(np.int64)
+        if (weather_idx == -1).any():
+            # Report the caller's value; the Categorical holds NaN there
+            unknown = np.asarray(weather, dtype=object)[weather_idx == -1][0]
+            raise ValueError(f"Unknown weather: {unknown}")
+        weather_lut = np.array(list(self.weather_categories.values()), dtype=np.float64)
+        
+        data = {
+            "crime_index": np.asarray(crime_index, dtype=np.float64),
+            "accident_rate": np.asarray(accident_rate, dtype=np.float64),
+            "socioeconomic_level": np.asarray(socioeconomic_level, dtype=np.float64),
+            "weather": categorical,
+        }
+        
+        if noise is not None:
+            return self._score_arrays(data, weather_idx, weather_lut, noise)
+        
+        # Score each distinct input combination once and broadcast the results
+        groups = self._group_duplicate_records(data, weather_idx)
+        if groups is not None:
+            group_idx, representatives = groups
+            unique_data = {field: values[representatives] for field, values in data.items()}
+            result = self._score_arrays(unique_data, weather_idx[representatives], weather_lut)
+            return {key: values[group_idx] for key, values in result.items()}
+        
+        return self._score_arrays(data, weather_idx, weather_lut)
+    
+    def _group_duplicate_records(self,
+                                 data: Dict[str, Any],
+                                 weather_idx: np.ndarray) -> Optional[tuple]:
+        """
+        Group records with identical inputs when enough of them repeat.
+        
+        Numeric values are compared by bit pattern, so -0.0 and 0.0 stay
+        distinct and results are identical to scoring every record.
+        
+        Args:
+            data: Input arrays keyed by field name
+            weather_idx: Weather category index per record
+            
+        Returns:
+            Tuple of (group index per record, index of one record per group),
+            or None if the unique ratio is too high for grouping to pay off
+        """
+        record_count = len(weather_idx)
+        if record_count == 0:
+            return None
+        
+        # Combine per-column codes pairwise, re-factorizing to stay in int64;
+        # stop as soon as the inputs are known to be mostly unique
+        max_groups = DEDUP_MAX_UNIQUE_RATIO * record_count
+        group_idx = weather_idx
+        for field in _NUMERIC_FIELDS:
+            codes, uniques = pd.factorize(data[field].view(np.int64))
+            group_idx, groups = pd.factorize(group_idx * len(uniques) + codes)
+            if len(groups) >= max_groups:
+                return None
+        group_count = len(groups)
+        
+        # Reverse order so each group keeps its first record
+        representatives = np.empty(group_count, dtype=np.int64)
+        representatives[group_idx[::-1]] = np.arange(record_count - 1, -1, -1)
+        return group_idx, representatives
+    
+    def _score_arrays(self,
+                      data: Dict[str, Any],
+                      weather_idx: np.ndarray,
+                      weather_lut: np.ndarray,
+                      noise: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Run the scoring pipeline over validated arrays.
+        
+        Args:
+            data: Input arrays keyed by field name
+            weather_idx: Weather category index per record
+            weather_lut: Weather component score per category index
+            noise: Noise per record added to the amplified score, or None
+            
+        Returns:
+            Dictionary of result arrays keyed like process_risk_data output
+        """
+        if NUMBA_AVAILABLE and noise is None:
+            compiled_rules = self._compile_rule_arrays()
+            if compiled_rules is not None:
+                return self._process_risk_arrays_compiled(data, weather_idx, weather_lut, compiled_rules)
+        
+        components = {
+            "crime_index": data["crime_index"] / 10.0,
+            "accident_rate": data["accident_rate"] / 10.0,
+            "socioeconomic_level": (11 - data["socioeconomic_level"]) / 9.0,
+            "weather": weather_lut[weather_idx],
+        }
+        
+        weighted_score = sum(
+            components[component] * self.weights[component]
+            for component in components
+        )
+        amplified_score = np.clip(weighted_score, 0.0, 1.0)
+        
+        for rule in self.rules:
+            rule_mask = self._evaluate_rule_conditions_array(rule["conditions"], data)
+            amplified_score = np.where(rule_mask, amplified_score * rule["multiplier"], amplified_score)
+        
+        if noise is not None:
+            amplified_score = np.clip(amplified_score + noise, 0.0, 1.0)
+        
+        result = {
+            "risk_score": _round_scores(np.clip(amplified_score * OUTPUT_SCALE, 0, OUTPUT_SCALE))
+        }
+        for key, score in zip(_RESULT_KEYS[1:], components.values()):
+            result[key] = _round_scores(
+                np.clip(score * OUTPUT_SCALE, 0, OUTPUT_SCALE)
+            )
+        
+        return result
+    
+    def _process_risk_arrays_compiled(self,
+                                      data: Dict[str, np.ndarray],
+                                      weather_idx: np.ndarray,
+                                      weather_lut: np.ndarray,
+                                      compiled_rules: tuple) -> Dict[str, np.ndarray]:
+        """
+        Run the Numba-compiled scoring kernel over validated arrays.
+        
+        Args:
+            data: Input arrays keyed by field name
+            weather_idx: Weather category index per record
+            weather_lut: Weather component score per category index
+            compiled_rules: Rule arrays from _compile_rule_arrays
+            
+        Returns:
+            Dictionary of result arrays keyed like process_risk_data output
+        """
+        weights = np.array([self.weights[field] for field in _COMPONENT_FIELDS], dtype=np.float64)
+        
+        scores = select_scores_kernel(len(weather_idx))(
+            np.ascontiguousarray(data["crime_index"]),
+            np.ascontiguousarray(data["accident_rate"]),
+            np.ascontiguousarray(data["socioeconomic_level"]),
+            weather_idx, weights, weather_lut, *compiled_rules, float(OUTPUT_SCALE)
+        )
+        
+        return {key: _round_scores(values) for key, values in zip(_RESULT_KEYS, scores)}
+    
+    def _compile_rule_arrays(self) -> Optional[tuple]:
+        """
+        Encode amplification rules as numeric arrays for the compiled kernel.
+        
+        Weather set conditions become bitmasks over weather category indices;
+        numeric conditions become (operator code, threshold) pairs.
+        
+        Returns:
+            Tuple of (multipliers, weather masks, operator codes, thresholds),
+            or None if a rule cannot be expressed this way
+        """
+        category_index = {name: idx for idx, name in enumerate(self.weather_categories)}
+        if len(category_index) > 62:
+            return None
+        all_weather = (1 << len(category_index)) - 1
+        
+        rule_count = len(self.rules)
+        multipliers = np.empty(rule_count, dtype=np.float64)
+        weather_masks = np.full(rule_count, all_weather, dtype=np.int64)
+        ops = np.full((rule_count, len(_NUMERIC_FIELDS)), OP_NONE, dtype=np.int64)
+        thresholds = np.zeros((rule_count, len(_NUMERIC_FIELDS)), dtype=np.float64)
+        operator_codes = {">": OP_GREATER, "<": OP_LESS, "=": OP_EQUAL}
+        
+        for rule_idx, rule in enumerate(self.rules):
+            multipliers[rule_idx] = rule["multiplier"]
+            for field, condition in rule["conditions"].items():
+                if field == "weather":
+                    if not isinstance(condition, (set, list)):
+                        return None
+                    weather_masks[rule_idx] = sum(
+                        1 << category_index[name] for name in set(condition) if name in category_index
+                    )
+                    continue
+                
+                if field not in _NUMERIC_FIELDS:
+                    return None
+                field_idx = _NUMERIC_FIELDS.index(field)
+                
+                if isinstance(condition, str):
+                    if len(condition) < 2 or condition[0] not in operator_codes:
+                        continue
+                    try:
+                        thresholds[rule_idx, field_idx] = float(condition[1:])
+                    except ValueError:
+                        continue
+                    ops[rule_idx, field_idx] = operator_codes[condition[0]]
+                elif isinstance(condition, (int, float)):
+                    thresholds[rule_idx, field_idx] = float(condition)
+                    ops[rule_idx, field_idx] = OP_EQUAL
+                else:
+                    return None
+        
+        return multipliers, weather_masks, ops, thresholds
+    
+    def supports_array_processing(self) -> bool:
+        """
+        Check whether process_risk_arrays reproduces process_risk_data output.
+        
+        Array processing is deterministic and evaluates rules only over the
+        four required indicators, with comparisons on numeric fields.
+        
+        Returns:
+            True if array processing can be used for this configuration
+        """
+        return self.noise_level == 0.0 and self._array_rules_supported()
+    
+    def _array_rules_supported(self) -> bool:
+        """
+        Check whether every amplification rule can be evaluated on arrays.
+        
+        Returns:
+            True if all rule conditions use the required indicators only
+        """
+        numeric_fields = {"crime_index", "accident_rate", "socioeconomic_level"}
+        for rule in self.rules:
+            for field, condition in rule["conditions"].items():
+                if field not in numeric_fields and field != "weather":
+                    return False
+                if field == "weather" and not isinstance(condition, (set, list)):
+                    return False
+        
+        return True
+    
     def _calculate_component_scores(self, data: Dict[str, Any]) -> Dict[str, float]:
         """
         Calculate normalized component scores (0-1 scale).
@@ -124,8 +660,11 @@ class RiskProcessor:
         # Higher socioeconomic level means lower risk
         components["socioeconomic_level"] = (11 - data["socioeconomic_level"]) / 9.0
         
-        # Weather component from predefined mapping
-        components["weather"] = self.weather_categories[data["weather"]]
+        # Weather component from predefined mapping (single dict lookup)
+        try:
+            components["weather"] = self.weather_categories[data["weather"]]
+        except KeyError:
+            raise ValidationError(f"Unknown weather: {data['weather']}")
         
         return components
     
@@ -139,10 +678,21 @@ class RiskProcessor:
         Returns:
             Weighted score (0-1 scale)
         """
-        weighted_score = sum(
-            components[component] * self.weights[component]
-            for component in components
-        )
+        # Unrolled when components come in the standard order, so the sum
+        # is evaluated exactly as the loop below would
+        if tuple(components) == _COMPONENT_FIELDS:
+            weights = self.weights
+            weighted_score = (
+                components["crime_index"] * weights["crime_index"]
+                + components["accident_rate"] * weights["accident_rate"]
+                + components["socioeconomic_level"] * weights["socioeconomic_level"]
+                + components["weather"] * weights["weather"]
+            )
+        else:
+            weighted_score = sum(
+                components[component] * self.weights[component]
+                for component in components
+            )
         
         # Ensure score stays within bounds
         return max(0.0, min(1.0, weighted_score))
@@ -187,6 +737,11 @@ class RiskProcessor:
         - Comparison operators: ">7", "<3", "=5"
         - Set membership: {"Stormy", "Snowy"}
         
+        Conditions are compiled into field checks on first use, so condition
+        strings are parsed once per rule rather than once per record. The
+        compiled checks are reused only while the conditions still hold the
+        same items, so conditions edited in place are recompiled.
+        
         Args:
             conditions: Dictionary of field conditions
             data: Input data to check against
@@ -194,14 +749,85 @@ class RiskProcessor:
         Returns:
             True if all conditions are satisfied, False otherwise
         """
-        for field, condition in conditions.items():
+        items = tuple(conditions.items())
+        compiled = self._compiled_conditions.get(id(conditions))
+        if compiled is None or compiled[0] != items:
+            if len(self._compiled_conditions) >= _MAX_COMPILED_CONDITIONS:
+                self._compiled_conditions.clear()
+            compiled = (items, self._compile_rule_conditions(conditions))
+            self._compiled_conditions[id(conditions)] = compiled
+        
+        for field, check, operand in compiled[1]:
             if field not in data:
                 return False
+            if check is not None and not check(data[field], operand):
+                return False
+        
+        return True
+    
+    def _compile_rule_conditions(self, conditions: Dict[str, Any]) -> List[Tuple[str, Optional[Callable[[Any, Any], bool]], Any]]:
+        """
+        Compile rule conditions into per-field checks.
+        
+        Args:
+            conditions: Dictionary of field conditions
             
-            field_value = data[field]
+        Returns:
+            List of (field, check, operand) tuples in condition order, where
+            check(value, operand) tells whether a value passes; check is None
+            for conditions that only require the field to be present
+        """
+        checks = []
+        
+        for field, condition in conditions.items():
+            check, operand = None, None
+            
+            if isinstance(condition, str):
+                # Comparison operators (">7", "<3", "=5"); malformed ones are ignored
+                compare = _CONDITION_OPERATORS.get(condition[:1]) if len(condition) >= 2 else None
+                if compare is not None:
+                    try:
+                        check, operand = compare, float(condition[1:])
+                    except ValueError:
+                        pass
+                    
+            elif isinstance(condition, (set, list)):
+                # Set membership checks
+                check, operand = _is_member, condition
+            
+            elif isinstance(condition, (int, float)):
+                # Direct value comparison
+                check, operand = _equals, condition
+            
+            checks.append((field, check, operand))
+        
+        return checks
+    
+    def _evaluate_rule_conditions_array(self,
+                                        conditions: Dict[str, Any],
+                                        data: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Evaluate rule conditions over arrays of records.
+        
+        Mirrors _evaluate_rule_conditions, producing one boolean per record.
+        
+        Args:
+            conditions: Dictionary of field conditions
+            data: Input arrays keyed by field name
+            
+        Returns:
+            Boolean mask of records satisfying all conditions
+        """
+        record_count = len(data["crime_index"])
+        mask = np.ones(record_count, dtype=bool)
+        
+        for field, condition in conditions.items():
+            if field not in data:
+                return np.zeros(record_count, dtype=bool)
+            
+            field_values = data[field]
             
             if isinstance(condition, str):
-                # Handle comparison operators (">7", "<3", "=5")
                 if len(condition) < 2:
                     continue
                 
@@ -211,24 +837,24 @@ class RiskProcessor:
                 except ValueError:
                     continue
                 
-                if operator == ">" and not (field_value > threshold):
-                    return False
-                elif operator == "<" and not (field_value < threshold):
-                    return False
-                elif operator == "=" and not (field_value == threshold):
-                    return False
+                if operator == ">":
+                    mask &= field_values > threshold
+                elif operator == "<":
+                    mask &= field_values < threshold
+                elif operator == "=":
+                    mask &= field_values == threshold
                     
             elif isinstance(condition, (set, list)):
-                # Handle set membership checks
-                if field_value not in condition:
-                    return False
+                if isinstance(field_values, pd.Categorical):
+                    # Matches categories once, then compares integer codes
+                    mask &= field_values.isin(list(condition))
+                else:
+                    mask &= np.isin(field_values, list(condition))
             
             elif isinstance(condition, (int, float)):
-                # Handle direct value comparison
-                if field_value != condition:
-                    return False
+                mask &= field_values == condition
         
-        return True
+        return mask
     
     def _add_statistical_noise(self, score: float) -> float:
         """
@@ -247,16 +873,32 @@ class RiskProcessor:
             return score  # Deterministic mode for testing
         
         # Add uniform random noise
-        noise = random.uniform(-self.noise_level, self.noise_level)
+        noise = self.noise_level * (2.0 * self._next_uniform() - 1.0)
         noisy_score = score + noise
         
         # Clamp to valid range
         return max(0.0, min(1.0, noisy_score))
     
+    def _next_uniform(self) -> float:
+        """
+        Return the next uniform [0, 1) value from the pre-drawn buffer.
+        
+        Drawing NOISE_BUFFER_SIZE values per Generator call avoids its
+        per-call overhead, which exceeds the cost of one draw.
+        
+        Returns:
+            Uniform random value
+        """
+        try:
+            return self._uniform_buffer.pop()
+        except IndexError:
+            self._uniform_buffer = self._rng.random(NOISE_BUFFER_SIZE).tolist()
+            return self._uniform_buffer.pop()
+    
     def _prepare_final_result(self, 
                             final_score: float, 
                             components: Dict[str, float], 
-                            input_data: Dict[str, Any]) -> Dict[str, Union[float, str]]:
+                            input_data: Dict[str, Any]) -> RiskResult:
         """
         Prepare the final result with proper scaling and formatting.
         
@@ -266,31 +908,20 @@ class RiskProcessor:
             input_data: Original input data
             
         Returns:
-            Dictionary with scaled scores and metadata
+            RiskResult with scaled scores and city
         """
         # Scale final score to output range (0-100)
         scaled_score = min(max(final_score * OUTPUT_SCALE, 0), OUTPUT_SCALE)
         
         # Scale component scores to output range and clamp to validation limits
         # This prevents validation errors when component values exceed 100 due to amplification
-        scaled_components = {
-            f"{component}_component": round(
-                min(max(score * OUTPUT_SCALE, 0), OUTPUT_SCALE), 2
-            )
-            for component, score in components.items()
-        }
-        
-        # Prepare final result
-        result = {
-            "risk_score": round(scaled_score, 2),
-            **scaled_components
-        }
+        scaled_components = [
+            round(min(max(components[component] * OUTPUT_SCALE, 0), OUTPUT_SCALE), 2)
+            for component in _COMPONENT_FIELDS
+        ]
         
-        # Add city if provided
-        if "city" in input_data:
-            result["city"] = input_data["city"]
-        
-        return result
+        # Prepare final result, with city if provided
+        return RiskResult(round(scaled_score, 2), *scaled_components, input_data.get("city"))
     
     def get_processor_info(self) -> Dict[str, Any]:
         """
@@ -307,6 +938,16 @@ class RiskProcessor:
             "output_scale": OUTPUT_SCALE
         }
     
+    def set_seed(self, seed: Optional[int] = None):
+        """
+        Reseed the statistical noise generator.
+        
+        Args:
+            seed: Seed for reproducible noise, or None for fresh entropy
+        """
+        self._rng = np.random.default_rng(seed)
+        self._uniform_buffer = []
+    
     def set_deterministic_mode(self, deterministic: bool = True):
         """
         Enable/disable deterministic mode for testing.
@@ -5,7 +5,8 @@ Provides comprehensive validation logic for risk data inputs including
 range checking, type validation, and strict weather category validation.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from src.config.constants import (
     WEATHER_CATEGORIES, CRIME_RANGE, ACCIDENT_RANGE, SOCIO_RANGE,
@@ -38,6 +39,57 @@ class RiskDataValidator:
         """
         Validate and clean risk data inputs.
         
+        Args:
+            data: Raw input data dictionary
+            
+        Returns:
+            Dict with validated and cleaned data
+            
+        Raises:
+            ValidationError: For validation failures with specific error messages
+        """
+        # Fast path for well-formed input: one conversion pass with inline
+        # range checks. Anything unusual (missing fields, wrong types, out of
+        # range values) goes through the field validators for exact messages
+        try:
+            crime_value = float(data["crime_index"])
+            accident_value = float(data["accident_rate"])
+            socio_value = float(data["socioeconomic_level"])
+            weather = data["weather"]
+        except (KeyError, TypeError, ValueError):
+            return self._validate_risk_data_fields(data)
+        city = data.get("city")
+        if type(weather) is not str or (city is not None and type(city) is not str):
+            return self._validate_risk_data_fields(data)
+        weather_str = weather.strip()
+        city_cleaned = None if city is None else city.strip()
+        
+        crime_min, crime_max = self.crime_range
+        accident_min, accident_max = self.accident_range
+        socio_min, socio_max = self.socio_range
+        if not (crime_min <= crime_value <= crime_max
+                and accident_min <= accident_value <= accident_max
+                and socio_min <= socio_value <= socio_max
+                and weather_str
+                and (weather_str in self.weather_categories or not self.reject_unknown_weather)
+                and (city is None or 0 < len(city_cleaned) <= 100)):
+            return self._validate_risk_data_fields(data)
+        
+        cleaned_data = {
+            "crime_index": crime_value,
+            "accident_rate": accident_value,
+            "socioeconomic_level": socio_value,
+            "weather": weather_str,
+        }
+        if city is not None:
+            cleaned_data["city"] = city_cleaned
+        
+        return cleaned_data
+    
+    def _validate_risk_data_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate risk data field by field, collecting every error message.
+        
         Args:
             data: Raw input data dictionary
             
@@ -250,21 +302,43 @@ class CSVValidator:
             errors.append("CSV file is empty")
             return errors
         
+        # Check column names (duplicates first, then required columns)
+        errors.extend(self.validate_csv_header(df.columns.tolist()))
+        
+        # Check for completely empty rows (all NaN)
+        empty_rows = df.isnull().all(axis=1).sum()
+        if empty_rows > 0:
+            errors.append(f"Found {empty_rows} completely empty rows")
+        
+        return errors
+    
+    def validate_csv_header(self, columns: List[str]) -> List[str]:
+        """
+        Validate CSV column names.
+        
+        Args:
+            columns: Column names in file order
+            
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        errors = []
+        
         # Check for duplicate column names first (higher priority error)
-        duplicate_columns = df.columns[df.columns.duplicated()].tolist()
+        seen = set()
+        duplicate_columns = []
+        for column in columns:
+            if column in seen and column not in duplicate_columns:
+                duplicate_columns.append(column)
+            seen.add(column)
         if duplicate_columns:
             errors.append(f"Duplicate column names: {', '.join(duplicate_columns)}")
         
         # Check for required columns
-        missing_columns = set(self.required_columns) - set(df.columns)
+        missing_columns = set(self.required_columns) - seen
         if missing_columns:
             errors.append(f"Missing required columns: {', '.join(missing_columns)}")
         
-        # Check for completely empty rows (all NaN)
-        empty_rows = df.isnull().all(axis=1).sum()
-        if empty_rows > 0:
-            errors.append(f"Found {empty_rows} completely empty rows")
-        
         return errors
     
     def validate_csv_row(self, row: pd.Series, row_index: int) -> Dict[str, Any]:
@@ -308,6 +382,230 @@ class CSVValidator:
                 "row_index": row_index
             }
     
+    def validate_csv_batch(self,
+                           df: pd.DataFrame,
+                           risk_validator: Optional[RiskDataValidator] = None) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Validate all CSV rows at once using column-wise operations.
+        
+        Produces the same per-row error messages as validate_csv_row, but
+        evaluates each rule over whole columns instead of row by row.
+        
+        Args:
+            df: Pandas DataFrame with the required columns
+            risk_validator: Validator whose ranges and weather settings apply
+                (defaults to this CSV validator's own)
+            
+        Returns:
+            Tuple of (cleaned column arrays keyed by field name, with weather
+            as a pd.Categorical, and per-row error messages where an empty
+            string marks a valid row)
+        """
+        risk_validator = risk_validator or self.risk_validator
+        row_count = len(df)
+        errors = np.full(row_count, "", dtype=object)
+        
+        # Missing required fields short-circuit all other checks for the row
+        missing_any = np.zeros(row_count, dtype=bool)
+        for field in self.required_columns:
+            missing = df[field].isna().to_numpy()
+            self._append_errors(errors, missing, f"Missing required field: {field}")
+            missing_any |= missing
+        
+        present = ~missing_any
+        cleaned = {}
+        
+        numeric_fields = [
+            ("crime_index", risk_validator.crime_range),
+            ("accident_rate", risk_validator.accident_range),
+            ("socioeconomic_level", risk_validator.socio_range),
+        ]
+        for field, value_range in numeric_fields:
+            cleaned[field] = self._validate_numeric_column(
+                df[field], field, value_range, present, errors
+            )
+        
+        cleaned["weather"] = self._validate_weather_column(df["weather"], risk_validator, present, errors)
+        
+        if "city" in df.columns:
+            self._validate_city_column(df["city"], present, errors)
+        
+        return cleaned, errors
+    
+    def _validate_numeric_column(self,
+                                 series: pd.Series,
+                                 field: str,
+                                 value_range: Tuple[int, int],
+                                 present: np.ndarray,
+                                 errors: np.ndarray) -> np.ndarray:
+        """
+        Coerce a numeric column and record type and range errors.
+        
+        Args:
+            series: Raw column values
+            field: Field name used in error messages
+            value_range: Inclusive (min, max) bounds
+            present: Mask of rows with all required fields present
+            errors: Per-row error messages, updated in place
+            
+        Returns:
+            Float64 array of coerced values (NaN where coercion failed)
+        """
+        type_errors = np.zeros(len(series), dtype=bool)
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            # Mixed or text columns get the row validator's float() per value,
+            # so parsed values (and the range messages echoing them) match
+            raw_values = series.to_numpy(dtype=object)
+            values = np.full(len(series), np.nan)
+            for position in np.flatnonzero(present & series.notna().to_numpy()):
+                try:
+                    values[position] = float(raw_values[position])
+                except (TypeError, ValueError):
+                    type_errors[position] = True
+        if type_errors.any():
+            self._append_errors(
+                errors, type_errors,
+                f"{field} must be a number, got " + self._type_names(raw_values[type_errors])
+            )
+        
+        # One masked assignment for all out-of-range rows; NumPy's float to
+        # string conversion gives the same shortest repr as str(float)
+        with np.errstate(invalid="ignore"):
+            in_range = (value_range[0] <= values) & (values <= value_range[1])
+        out_of_range = present & ~type_errors & ~in_range
+        if out_of_range.any():
+            self._append_errors(
+                errors, out_of_range,
+                f"{field} must be between {value_range[0]} and {value_range[1]}, got "
+                + values[out_of_range].astype(str).astype(object)
+            )
+        
+        return values
+    
+    def _validate_weather_column(self,
+                                 series: pd.Series,
+                                 risk_validator: RiskDataValidator,
+                                 present: np.ndarray,
+                                 errors: np.ndarray) -> np.ndarray:
+        """
+        Strip weather values and record type, empty and unknown-category errors.
+        
+        Args:
+            series: Raw weather column
+            risk_validator: Validator with the weather categories to accept
+            present: Mask of rows with all required fields present
+            errors: Per-row error messages, updated in place
+            
+        Returns:
+            Categorical of stripped weather values over the known weather
+            categories (unknown values have code -1)
+        """
+        stripped, non_string = self._strip_string_column(series)
+        self._append_type_errors(errors, "weather", series, present & non_string)
+        
+        weather = stripped.to_numpy(dtype=object)
+        is_string = present & ~non_string
+        self._append_errors(errors, is_string & (weather == ""), "weather cannot be empty")
+        
+        # Integer category codes replace per-row string lookups downstream
+        categorical = pd.Categorical(weather, categories=list(risk_validator.weather_categories))
+        
+        if risk_validator.reject_unknown_weather:
+            unknown = is_string & (weather != "") & (categorical.codes == -1)
+            if unknown.any():
+                self._append_errors(errors, unknown, "Unknown weather: " + weather[unknown])
+        
+        return categorical
+    
+    def _validate_city_column(self,
+                              series: pd.Series,
+                              present: np.ndarray,
+                              errors: np.ndarray):
+        """
+        Record errors for the optional city column.
+        
+        Args:
+            series: Raw city column
+            present: Mask of rows with all required fields present
+            errors: Per-row error messages, updated in place
+        """
+        provided = present & series.notna().to_numpy()
+        stripped, non_string = self._strip_string_column(series)
+        self._append_type_errors(errors, "city", series, provided & non_string)
+        
+        is_string = provided & ~non_string
+        lengths = stripped.str.len().to_numpy(dtype=np.float64, na_value=0)
+        self._append_errors(errors, is_string & (lengths == 0), "city cannot be empty or whitespace only")
+        self._append_errors(errors, is_string & (lengths > 100), "city name cannot exceed 100 characters")
+    
+    def _strip_string_column(self, series: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+        """
+        Strip string values in a column and flag non-string entries.
+        
+        Args:
+            series: Raw column values
+            
+        Returns:
+            Tuple of (stripped values, mask of non-missing non-string entries)
+        """
+        try:
+            stripped = series.str.strip()
+        except AttributeError:
+            # Non-string dtype (e.g. an all-numeric column)
+            stripped = pd.Series(np.nan, index=series.index, dtype=object)
+        non_string = (stripped.isna() & series.notna()).to_numpy()
+        return stripped, non_string
+    
+    def _append_type_errors(self, errors: np.ndarray, field: str, series: pd.Series, mask: np.ndarray):
+        """
+        Record "must be a string" errors for the masked rows.
+        
+        Args:
+            errors: Per-row error messages, updated in place
+            field: Field name used in error messages
+            series: Raw column values
+            mask: Rows holding non-string values
+        """
+        if not mask.any():
+            return
+        raw_values = series.to_numpy(dtype=object)[mask]
+        self._append_errors(errors, mask, f"{field} must be a string, got " + self._type_names(raw_values))
+    
+    @staticmethod
+    def _type_names(values: np.ndarray) -> np.ndarray:
+        """
+        Get the type name of each value, as used in type error messages.
+        
+        Args:
+            values: Object array of raw values
+            
+        Returns:
+            Object array of type names
+        """
+        return np.array([type(value).__name__ for value in values], dtype=object)
+    
+    @staticmethod
+    def _append_errors(errors: np.ndarray, selector: Any, message: Any):
+        """
+        Append an error message to the selected rows, joining with "; ".
+        
+        Args:
+            errors: Per-row error messages, updated in place
+            selector: Boolean mask or integer position of rows to update
+            message: Error message to append, or an array with one message
+                per selected row
+        """
+        # Nothing selected: skip indexing and the per-row message join
+        if not isinstance(selector, (int, np.integer)) and not selector.any():
+            return
+        current = errors[selector]
+        if isinstance(current, str):
+            errors[selector] = f"{current}; {message}" if current else message
+            return
+        errors[selector] = np.where(current == "", message, current + "; " + message)
+    
     def get_validation_summary(self, results: List[Dict]) -> Dict[str, int]:
         """
         Generate validation summary statistics.
@@ -6,20 +6,47 @@ per-row error tracking, and detailed logging of processing statistics.
 Error rows are retained in output with proper status indicators.
 """
 
+import csv
+import os
+import numpy as np
 import pandas as pd
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from io import StringIO
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pa_csv = None
+
 from src.core.risk_processor import RiskProcessor
 from src.core.validators import CSVValidator, ValidationError
 from src.services.logger_service import LoggerService
 from src.config.constants import (
-    CSV_MAX_WORKERS, CSV_OUTPUT_COLUMNS, CSV_REQUIRED_COLUMNS, CSV_OPTIONAL_COLUMNS
+    CSV_MAX_WORKERS, CSV_CHUNK_SIZE, CSV_STREAM_CHUNK_SIZE, CSV_OUTPUT_COLUMNS,
+    CSV_REQUIRED_COLUMNS, CSV_OPTIONAL_COLUMNS
 )
 
 
+# pandas' default NA markers, so the Arrow reader yields the same missing values
+_CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null"
+]
+
+# pandas' boolean tokens; Arrow's defaults would also read 1/0 as booleans
+_CSV_TRUE_VALUES = ["True", "TRUE", "true"]
+_CSV_FALSE_VALUES = ["False", "FALSE", "false"]
+
+# Text columns are always read as strings, so a numeric-looking city or
+# weather cell validates the same whatever the other rows (or chunk) hold
+_CSV_TEXT_DTYPES = {"city": str, "weather": str}
+
+
 class CSVProcessingError(Exception):
     """Custom exception for CSV processing errors."""
     pass
@@ -48,7 +75,19 @@ class CSVProcessor:
         self.risk_processor = risk_processor
         self.csv_validator = CSVValidator()
         self.logger = LoggerService()
-        self.max_workers = CSV_MAX_WORKERS
+        self.max_workers = min(CSV_MAX_WORKERS, os.cpu_count() or 1)
+        self.chunk_size = CSV_CHUNK_SIZE
+        
+        # Output column dtypes: numeric scores (NaN on error rows), compact status
+        self._output_dtypes = {
+            "risk_score": "float64",
+            "crime_index_component": "float64",
+            "accident_rate_component": "float64",
+            "socioeconomic_level_component": "float64",
+            "weather_component": "float64",
+            "processing_status": pd.CategoricalDtype(["SUCCESS", "ERROR"]),
+            "error_message": "string"
+        }
     
     def process_csv_file(self, file_content: str, filename: Optional[str] = None) -> pd.DataFrame:
         """
@@ -76,36 +115,8 @@ class CSVProcessor:
             # Parse CSV content
             df = self._parse_csv_content(file_content, filename_display)
             
-            # Validate CSV structure
-            structural_errors = self.csv_validator.validate_csv_structure(df)
-            if structural_errors:
-                error_msg = f"CSV structural errors: {'; '.join(structural_errors)}"
-                self.logger.log_error(f"CSV validation failed for {filename_display}: {error_msg}")
-                raise CSVProcessingError(error_msg)
-            
-            # Process rows with multi-threading
-            result_df = self._process_rows_concurrent(df, filename_display)
-            
-            # Calculate processing statistics
-            processing_time = time.time() - start_time
-            total_rows = len(result_df)
-            error_count = len(result_df[result_df['processing_status'] == 'ERROR'])
-            success_count = total_rows - error_count
-            
-            # Log processing summary
-            self.logger.log_csv_processing_summary(
-                total_rows, success_count, error_count, processing_time
-            )
-            
-            self.logger.log_processing_complete(
-                f"CSV processing: {filename_display}",
-                {
-                    "total_rows": total_rows,
-                    "successful_rows": success_count,
-                    "error_rows": error_count,
-                    "processing_time_seconds": round(processing_time, 2)
-                }
-            )
+            result_df = self._process_dataframe(df, filename_display)
+            self._log_processing_summary(result_df, filename_display, start_time)
             
             return result_df
             
@@ -117,6 +128,142 @@ class CSVProcessor:
             self.logger.log_error(f"CSV processing failed for {filename_display}", e)
             raise CSVProcessingError(error_msg)
     
+    def process_csv_stream(self,
+                           path_or_buffer: Any,
+                           filename: Optional[str] = None,
+                           chunksize: int = CSV_STREAM_CHUNK_SIZE) -> pd.DataFrame:
+        """
+        Process a CSV file or buffer in chunks without loading it as one string.
+        
+        Rows are read chunksize at a time, so peak memory holds one parsed
+        chunk plus the accumulated results instead of the raw file content
+        and its full parsed copy. Structure validation runs on each chunk.
+        Cells are read as text, so no chunk's dtype inference affects how a
+        row is validated; the echoed input columns are then given the dtypes
+        a whole-file parse would infer, matching process_csv_file.
+        
+        Args:
+            path_or_buffer: File path or readable text buffer with CSV data
+            filename: Optional filename for logging purposes
+            chunksize: Number of rows to read and process at a time
+            
+        Returns:
+            DataFrame with processing results including error tracking
+            
+        Raises:
+            CSVProcessingError: For unreadable or structurally invalid CSV data
+        """
+        start_time = time.time()
+        filename_display = filename or "uploaded_file"
+        
+        self.logger.log_processing_start(
+            f"CSV stream processing: {filename_display}",
+            {"max_workers": self.max_workers, "chunksize": chunksize}
+        )
+        
+        try:
+            results = []
+            input_columns = None
+            with pd.read_csv(path_or_buffer, chunksize=chunksize, dtype=str, on_bad_lines='skip') as reader:
+                for chunk in reader:
+                    if not chunk.empty:
+                        input_columns = chunk.columns
+                        results.append(self._process_dataframe(chunk, filename_display))
+            
+            if not results:
+                raise CSVProcessingError("CSV file contains no data")
+            
+            result_df = pd.concat(results) if len(results) > 1 else results[0]
+            for column in input_columns.difference(list(_CSV_TEXT_DTYPES), sort=False):
+                result_df[column] = self._infer_column_dtype(result_df[column])
+            self._log_processing_summary(result_df, filename_display, start_time)
+            
+            return result_df
+            
+        except CSVProcessingError:
+            raise
+        except pd.errors.EmptyDataError:
+            raise CSVProcessingError("CSV file contains no data")
+        except Exception as e:
+            error_msg = f"Unexpected CSV processing error: {str(e)}"
+            self.logger.log_error(f"CSV processing failed for {filename_display}", e)
+            raise CSVProcessingError(error_msg)
+    
+    @staticmethod
+    def _infer_column_dtype(values: pd.Series) -> pd.Series:
+        """
+        Convert a column read as text to the dtype pandas infers for it.
+        
+        The cells are written back out and re-read as a one-column CSV, so
+        the conversion is the parser's own inference. Missing cells are
+        written as NaN, since a blank line would not read as one.
+        
+        Args:
+            values: Column cells as strings (NaN for missing cells)
+            
+        Returns:
+            Column with the inferred dtype and the original index
+        """
+        content = "value\n" + "\n".join(values.fillna("NaN")) + "\n"
+        if '"' in content or ',' in content or '\r' in content or content.count("\n") != len(values) + 1:
+            # Cells that need quoting
+            content = values.to_csv(index=False, na_rep="NaN")
+        parsed = pd.read_csv(StringIO(content), skip_blank_lines=False).iloc[:, 0]
+        return parsed.set_axis(values.index).rename(values.name)
+    
+    def _process_dataframe(self, df: pd.DataFrame, filename: str) -> pd.DataFrame:
+        """
+        Validate the structure of parsed CSV rows and process them.
+        
+        Args:
+            df: Parsed CSV rows
+            filename: Filename for logging purposes
+            
+        Returns:
+            DataFrame with processing results and error tracking
+            
+        Raises:
+            CSVProcessingError: If the CSV structure is invalid
+        """
+        structural_errors = self.csv_validator.validate_csv_structure(df)
+        if structural_errors:
+            error_msg = f"CSV structural errors: {'; '.join(structural_errors)}"
+            self.logger.log_error(f"CSV validation failed for {filename}: {error_msg}")
+            raise CSVProcessingError(error_msg)
+        
+        # Process all rows column-wise when possible, otherwise per row in threads
+        if self._can_process_vectorized():
+            return self._process_rows_vectorized(df, filename)
+        return self._process_parallel_fallback(df, filename)
+    
+    def _log_processing_summary(self, result_df: pd.DataFrame, filename: str, start_time: float):
+        """
+        Log processing statistics for a completed CSV file.
+        
+        Args:
+            result_df: Processing results
+            filename: Filename for logging purposes
+            start_time: Processing start time from time.time()
+        """
+        processing_time = time.time() - start_time
+        total_rows = len(result_df)
+        error_count = int((result_df['processing_status'] == 'ERROR').sum())
+        success_count = total_rows - error_count
+        
+        self.logger.log_csv_processing_summary(
+            total_rows, success_count, error_count, processing_time
+        )
+        
+        self.logger.log_processing_complete(
+            f"CSV processing: {filename}",
+            {
+                "total_rows": total_rows,
+                "successful_rows": success_count,
+                "error_rows": error_count,
+                "processing_time_seconds": round(processing_time, 2)
+            }
+        )
+    
     def _parse_csv_content(self, content: str, filename: str) -> pd.DataFrame:
         """
         Parse CSV content into DataFrame with proper error handling.
@@ -132,8 +279,11 @@ class CSVProcessor:
             CSVProcessingError: If parsing fails
         """
         try:
-            # Parse CSV with pandas, skip bad lines to handle malformed rows
-            df = pd.read_csv(StringIO(content), on_bad_lines='skip')
+            # Parse CSV with the Arrow reader when available, else pandas;
+            # both skip bad lines to handle malformed rows
+            df = self._read_csv_arrow(content, filename)
+            if df is None:
+                df = pd.read_csv(StringIO(content), dtype=_CSV_TEXT_DTYPES, on_bad_lines='skip')
             
             if df.empty:
                 raise CSVProcessingError("CSV file contains no data")
@@ -155,7 +305,8 @@ class CSVProcessor:
             self.logger.log_error(f"CSV parsing warning for {filename}: {str(e)}")
             try:
                 # Try with skip_blank_lines and error handling
-                df = pd.read_csv(StringIO(content), on_bad_lines='skip', skip_blank_lines=True)
+                df = pd.read_csv(StringIO(content), dtype=_CSV_TEXT_DTYPES, on_bad_lines='skip',
+                                 skip_blank_lines=True)
                 if df.empty:
                     raise CSVProcessingError("CSV file contains no valid data")
                 return df
@@ -164,7 +315,195 @@ class CSVProcessor:
         except Exception as e:
             raise CSVProcessingError(f"Failed to parse CSV: {str(e)}")
     
-    def _process_rows_concurrent(self, df: pd.DataFrame, filename: str) -> pd.DataFrame:
+    def _can_process_vectorized(self) -> bool:
+        """
+        Check whether rows can be processed column-wise.
+        
+        The vectorized path is used for deterministic processing with the
+        stock per-record pipeline. Noise, rules the array evaluator cannot
+        express, lenient weather validation, validator weather categories
+        the processor cannot score, or an overridden/patched
+        process_risk_data fall back to per-row processing.
+        
+        Returns:
+            True if the vectorized path reproduces per-row results
+        """
+        processor = self.risk_processor
+        if "process_risk_data" in vars(processor):
+            return False
+        if type(processor).process_risk_data is not RiskProcessor.process_risk_data:
+            return False
+        if not processor.validator.reject_unknown_weather:
+            return False
+        if not processor.weather_categories.keys() >= set(processor.validator.weather_categories):
+            return False
+        return processor.supports_array_processing()
+    
+    def _read_csv_arrow(self, content: str, filename: str) -> Optional[pd.DataFrame]:
+        """
+        Parse CSV content with PyArrow's multithreaded reader.
+        
+        Rows with extra fields are skipped during the Arrow parse, as pandas
+        does with on_bad_lines='skip', and the skipped rows are logged. Input
+        the pandas parser would read differently (short rows, an extra field
+        on the first data row, duplicate headers, date/time-like columns,
+        whole-number float columns) or cannot be parsed is left to the pandas
+        parser by returning None.
+        
+        Args:
+            content: Raw CSV content string
+            filename: Filename for logging purposes
+            
+        Returns:
+            Parsed DataFrame, or None if pandas should parse the content
+        """
+        if pa_csv is None:
+            return None
+        
+        skipped_rows = []
+        
+        def handle_invalid_row(row) -> str:
+            # pandas pads short rows with NaN, which Arrow cannot do
+            if row.actual_columns < row.expected_columns:
+                return "error"
+            skipped_rows.append(row.text)
+            return "skip"
+        
+        try:
+            table = pa_csv.read_csv(
+                pa.BufferReader(content.encode('utf-8')),
+                parse_options=pa_csv.ParseOptions(invalid_row_handler=handle_invalid_row),
+                convert_options=pa_csv.ConvertOptions(
+                    null_values=_CSV_NULL_VALUES,
+                    true_values=_CSV_TRUE_VALUES,
+                    false_values=_CSV_FALSE_VALUES,
+                    column_types={name: pa.string() for name in _CSV_TEXT_DTYPES},
+                    strings_can_be_null=True
+                )
+            )
+        except pa.ArrowException:
+            return None
+        
+        # pandas turns an extra field on the first data row into an index column
+        if skipped_rows and self._first_row_has_extra_fields(content):
+            return None
+        
+        if any(pa.types.is_temporal(field.type) for field in table.schema):
+            return None
+        
+        # Arrow reads '+'-signed integers and integers beyond int64 as double,
+        # where pandas keeps an integer (or text) column
+        for field, column in zip(table.schema, table.columns):
+            if pa.types.is_floating(field.type) and column.null_count == 0:
+                values = column.to_numpy()
+                if np.array_equal(np.floor(values), values):
+                    return None
+        
+        # All-empty columns are float64 NaN in pandas, not Arrow's null type
+        for position, field in enumerate(table.schema):
+            if pa.types.is_null(field.type):
+                table = table.set_column(
+                    position, field.name, pa.nulls(table.num_rows, type=pa.float64())
+                )
+        
+        try:
+            df = table.to_pandas()
+        except ValueError:
+            # Duplicate column names; pandas renames them instead
+            return None
+        
+        # Missing cells of text columns are None from Arrow but NaN in pandas
+        for field, column in zip(table.schema, table.columns):
+            if pa.types.is_string(field.type) and column.null_count:
+                df[field.name] = df[field.name].where(df[field.name].notna(), np.nan)
+        
+        if skipped_rows:
+            self.logger.log_warning(
+                f"Skipped {len(skipped_rows)} malformed CSV rows in {filename}",
+                {"first_skipped_row": skipped_rows[0]}
+            )
+        
+        return df
+    
+    @staticmethod
+    def _first_row_has_extra_fields(content: str) -> bool:
+        """
+        Check whether the first data row has more fields than the header.
+        
+        Args:
+            content: Raw CSV content string
+            
+        Returns:
+            True if the first non-blank data row is longer than the header
+        """
+        rows = (row for row in csv.reader(StringIO(content)) if row)
+        header = next(rows, [])
+        first_row = next(rows, [])
+        return len(first_row) > len(header)
+    
+    def _process_rows_vectorized(self, df: pd.DataFrame, filename: str) -> pd.DataFrame:
+        """
+        Process all DataFrame rows at once with NumPy column operations.
+        
+        Args:
+            df: Input DataFrame to process
+            filename: Filename for logging purposes
+            
+        Returns:
+            DataFrame with processing results and error tracking
+        """
+        self.logger.log_info(
+            f"Starting vectorized processing: {filename}",
+            {"total_rows": len(df)}
+        )
+        
+        result_df = self._initialize_result_dataframe(df)
+        
+        total_rows = len(df)
+        errors = np.empty(total_rows, dtype=object)
+        valid = np.empty(total_rows, dtype=bool)
+        
+        # Error rows keep NaN scores (written as blank cells on export)
+        score_columns = {
+            column: np.full(total_rows, np.nan)
+            for column, dtype in self._output_dtypes.items() if dtype == "float64"
+        }
+        
+        # Fixed-size chunks bound the size of intermediate arrays on large files
+        for start in range(0, total_rows, self.chunk_size):
+            stop = min(start + self.chunk_size, total_rows)
+            cleaned, chunk_errors = self.csv_validator.validate_csv_batch(
+                df.iloc[start:stop], self.risk_processor.validator
+            )
+            chunk_valid = chunk_errors == ""
+            errors[start:stop] = chunk_errors
+            valid[start:stop] = chunk_valid
+            
+            scores = self.risk_processor.process_risk_arrays(
+                cleaned["crime_index"][chunk_valid],
+                cleaned["accident_rate"][chunk_valid],
+                cleaned["socioeconomic_level"][chunk_valid],
+                cleaned["weather"][chunk_valid]
+            )
+            for column, values in scores.items():
+                score_columns[column][start:stop][chunk_valid] = values
+        
+        for column, values in score_columns.items():
+            result_df[column] = values
+        
+        result_df["processing_status"] = pd.Categorical.from_codes(
+            np.where(valid, 0, 1), dtype=self._output_dtypes["processing_status"]
+        )
+        result_df["error_message"] = pd.array(errors, dtype=self._output_dtypes["error_message"])
+        
+        self.logger.log_errors_batch(
+            filename,
+            [(row_idx + 1, error) for row_idx, error in zip(df.index[~valid], errors[~valid])]
+        )
+        
+        return result_df
+    
+    def _process_parallel_fallback(self, df: pd.DataFrame, filename: str) -> pd.DataFrame:
         """
         Process DataFrame rows concurrently with error handling.
         
@@ -190,49 +529,54 @@ class CSVProcessor:
         # Track errors for logging
         row_errors = []
         
-        # Process rows with ThreadPoolExecutor
+        # Several rows per task amortize executor overhead; about four tasks
+        # per worker keeps the load balanced
+        # Plain dicts built in one pass instead of one Series per row
+        rows = list(zip(df.index, df.to_dict('records')))
+        batch_size = max(1, total_rows // (self.max_workers * 4))
+        batches = [rows[start:start + batch_size] for start in range(0, total_rows, batch_size)]
+        
+        # Process row batches with ThreadPoolExecutor; map yields them in input order
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all rows for processing
-            future_to_index = {
-                executor.submit(self._process_single_row, row, idx): idx
-                for idx, row in df.iterrows()
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                row_idx = future_to_index[future]
-                
-                try:
-                    row_result = future.result()
+            for batch_results in executor.map(self._process_row_batch, batches):
+                for row_idx, row_result, error in batch_results:
                     self._update_result_row(result_df, row_idx, row_result)
                     
-                    # Log individual row errors
-                    if row_result["status"] == "ERROR":
-                        error_info = {
-                            "row": row_idx + 1,
-                            "error": row_result["error"]
-                        }
-                        row_errors.append(error_info)
-                        self.logger.log_error(f"Row {row_idx + 1}: {row_result['error']}")
-                        
-                except Exception as e:
-                    # Handle unexpected processing errors
-                    error_msg = f"Unexpected processing error: {str(e)}"
-                    error_result = {
-                        "status": "ERROR",
-                        "error": error_msg
-                    }
-                    self._update_result_row(result_df, row_idx, error_result)
-                    
-                    error_info = {
-                        "row": row_idx + 1,
-                        "error": error_msg
-                    }
-                    row_errors.append(error_info)
-                    self.logger.log_error(f"Row {row_idx + 1}: {error_msg}", e)
+                    if error is not None:
+                        # Logged individually to keep the stack trace
+                        self.logger.log_error(f"Row {row_idx + 1}: {row_result['error']}", error)
+                    elif row_result["status"] == "ERROR":
+                        # Collect row errors for a single batched log call
+                        row_errors.append((row_idx + 1, row_result["error"]))
+        
+        self.logger.log_errors_batch(filename, row_errors)
         
         return result_df
     
+    def _process_row_batch(self,
+                           rows: List[Tuple[Any, Dict[str, Any]]]) -> List[Tuple[Any, Dict[str, Any], Optional[Exception]]]:
+        """
+        Process a batch of CSV rows in one worker task.
+        
+        Args:
+            rows: List of (row index, row) pairs
+            
+        Returns:
+            List of (row index, row result, unexpected exception or None) tuples
+        """
+        results = []
+        for row_idx, row in rows:
+            try:
+                results.append((row_idx, self._process_single_row(row, row_idx), None))
+            except Exception as e:
+                # Handle unexpected processing errors without failing the batch
+                error_result = {
+                    "status": "ERROR",
+                    "error": f"Unexpected processing error: {str(e)}"
+                }
+                results.append((row_idx, error_result, e))
+        return results
+    
     def _initialize_result_dataframe(self, input_df: pd.DataFrame) -> pd.DataFrame:
         """
         Initialize result DataFrame with proper column structure.
@@ -251,46 +595,36 @@ class CSVProcessor:
             if optional_col not in result_df.columns:
                 result_df[optional_col] = ""
         
-        # Initialize all output columns
-        output_columns = [
-            "risk_score", "crime_index_component", "accident_rate_component",
-            "socioeconomic_level_component", "weather_component"
-        ]
-        
-        for col in output_columns:
-            result_df[col] = ""
-        
-        # Initialize status tracking columns
-        result_df["processing_status"] = "SUCCESS"
-        result_df["error_message"] = ""
+        # Initialize score columns (NaN until scored) and status tracking columns
+        initial_values = {"processing_status": "SUCCESS", "error_message": ""}
+        for col, dtype in self._output_dtypes.items():
+            result_df[col] = pd.Series(
+                initial_values.get(col, np.nan), index=result_df.index, dtype=dtype
+            )
         
         # Reorder columns to match expected output format
-        column_order = []
-        for col in CSV_OUTPUT_COLUMNS:
-            if col in result_df.columns:
-                column_order.append(col)
+        present_columns = set(result_df.columns)
+        column_order = [col for col in CSV_OUTPUT_COLUMNS if col in present_columns]
         
         # Add any remaining columns not in the standard output
-        for col in result_df.columns:
-            if col not in column_order:
-                column_order.append(col)
+        standard_columns = frozenset(column_order)
+        column_order.extend(col for col in result_df.columns if col not in standard_columns)
         
         return result_df[column_order]
     
-    def _process_single_row(self, row: pd.Series, row_index: int) -> Dict[str, Any]:
+    def _process_single_row(self, row: Dict[str, Any], row_index: int) -> Dict[str, Any]:
         """
         Process a single CSV row and return result with status.
         
         Args:
-            row: Pandas Series representing a single row
+            row: Column values for a single row
             row_index: Row index for error reporting
             
         Returns:
             Dict with processing status and results or error information
         """
         try:
-            # Convert row to dictionary and handle NaN values
-            row_data = row.to_dict()
+            row_data = dict(row)
             
             # Replace NaN values with None for proper validation
             for key, value in row_data.items():
@@ -334,21 +668,21 @@ class CSVProcessor:
             # Update successful row with calculated values
             data = row_result["data"]
             
-            result_df.at[row_idx, "risk_score"] = data.get("risk_score", "")
-            result_df.at[row_idx, "crime_index_component"] = data.get("crime_index_component", "")
-            result_df.at[row_idx, "accident_rate_component"] = data.get("accident_rate_component", "")
-            result_df.at[row_idx, "socioeconomic_level_component"] = data.get("socioeconomic_level_component", "")
-            result_df.at[row_idx, "weather_component"] = data.get("weather_component", "")
+            result_df.at[row_idx, "risk_score"] = data.get("risk_score", np.nan)
+            result_df.at[row_idx, "crime_index_component"] = data.get("crime_index_component", np.nan)
+            result_df.at[row_idx, "accident_rate_component"] = data.get("accident_rate_component", np.nan)
+            result_df.at[row_idx, "socioeconomic_level_component"] = data.get("socioeconomic_level_component", np.nan)
+            result_df.at[row_idx, "weather_component"] = data.get("weather_component", np.nan)
             result_df.at[row_idx, "processing_status"] = "SUCCESS"
             result_df.at[row_idx, "error_message"] = ""
             
         else:
-            # Update error row with blank scores and error information
-            result_df.at[row_idx, "risk_score"] = ""
-            result_df.at[row_idx, "crime_index_component"] = ""
-            result_df.at[row_idx, "accident_rate_component"] = ""
-            result_df.at[row_idx, "socioeconomic_level_component"] = ""
-            result_df.at[row_idx, "weather_component"] = ""
+            # Update error row with missing scores and error information
+            result_df.at[row_idx, "risk_score"] = np.nan
+            result_df.at[row_idx, "crime_index_component"] = np.nan
+            result_df.at[row_idx, "accident_rate_component"] = np.nan
+            result_df.at[row_idx, "socioeconomic_level_component"] = np.nan
+            result_df.at[row_idx, "weather_component"] = np.nan
             result_df.at[row_idx, "processing_status"] = "ERROR"
             result_df.at[row_idx, "error_message"] = row_result["error"]
     
@@ -356,6 +690,10 @@ class CSVProcessor:
         """
         Validate CSV file structure without processing data.
         
+        Only the header line and the first data row are read, so the cost
+        does not grow with file size. Row-level checks happen during
+        process_csv_file.
+        
         Args:
             file_content: CSV file content as string
             
@@ -367,13 +705,17 @@ class CSVProcessor:
             return ["CSV file is empty"]
         
         try:
-            df = pd.read_csv(StringIO(file_content))
-            return self.csv_validator.validate_csv_structure(df)
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "no columns" in error_msg or "empty" in error_msg:
-                return ["CSV file is empty"]
+            # csv.reader yields [] for blank lines, which pandas also skips
+            rows = csv.reader(StringIO(file_content))
+            header = next((row for row in rows if row), None)
+            has_data = any(row for row in rows)
+        except csv.Error as e:
             return [f"Failed to parse CSV for validation: {str(e)}"]
+        
+        if header is None or not has_data:
+            return ["CSV file is empty"]
+        
+        return self.csv_validator.validate_csv_header(header)
     
     def get_processing_info(self) -> Dict[str, Any]:
         """
@@ -384,6 +726,7 @@ class CSVProcessor:
         """
         return {
             "max_workers": self.max_workers,
+            "chunk_size": self.chunk_size,
             "required_columns": CSV_REQUIRED_COLUMNS.copy(),
             "optional_columns": CSV_OPTIONAL_COLUMNS.copy(),
             "output_columns": CSV_OUTPUT_COLUMNS.copy(),
@@ -9,11 +9,14 @@ formatting according to the system requirements.
 import logging
 import os
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, List, Tuple
 from src.config.constants import (
     GENERAL_LOG_PATH, ERROR_LOG_PATH, LOG_FORMAT, LOG_DATE_FORMAT
 )
 
+# Context key fragments whose values are never written to the logs
+_SENSITIVE_FIELDS = frozenset({'password', 'token', 'key', 'secret', 'auth'})
+
 
 class LoggerService:
     """
@@ -162,6 +165,21 @@ class LoggerService:
         else:
             self.error_logger.error(formatted_message)
     
+    def log_errors_batch(self, file_name: str, errors: List[Tuple[int, str]]):
+        """
+        Log a batch of row errors to error.log with a single logger call.
+        
+        Args:
+            file_name: Name of the file the rows belong to
+            errors: List of (row_number, error_message) tuples
+        """
+        if not errors:
+            return
+        
+        lines = [f"Row {row_number}: {message}" for row_number, message in errors]
+        header = f"{len(errors)} row errors in {file_name}"
+        self.error_logger.error("\n".join([header, *lines]))
+    
     def log_critical(self, message: str, error: Optional[Exception] = None, context: Optional[dict] = None):
         """
         Log critical error message to error.log.
@@ -279,10 +297,9 @@ class LoggerService:
             Sanitized context dictionary
         """
         sanitized = {}
-        sensitive_fields = {'password', 'token', 'key', 'secret', 'auth'}
         
         for key, value in context.items():
-            if any(sensitive_field in key.lower() for sensitive_field in sensitive_fields):
+            if any(sensitive_field in key.lower() for sensitive_field in _SENSITIVE_FIELDS):
                 sanitized[key] = "[REDACTED]"
             else:
                 sanitized[key] = self._sanitize_value(value)
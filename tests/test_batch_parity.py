@@ -0,0 +1,249 @@
+"""
+Parity tests for the batch scoring entry points.
+
+process_risk_batch, process_risk_arrays and process_risk_stream must return
+exactly the scores process_risk_data gives for each record, whichever
+scoring path (NumPy, serial or parallel Numba kernel, duplicate grouping)
+handles the batch.
+"""
+
+import os
+import random
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.core._risk_kernel as risk_kernel
+import src.core.risk_processor as risk_processor
+from src.config.constants import WEATHER_CATEGORIES
+from src.core.risk_processor import RiskProcessor
+from src.core.validators import ValidationError
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+RESULT_KEYS = [
+    "risk_score", "crime_index_component", "accident_rate_component",
+    "socioeconomic_level_component", "weather_component"
+]
+
+CUSTOM_RULES = [
+    {
+        "conditions": {"crime_index": ">5", "accident_rate": "<5", "weather": ["Clear", "Rainy"]},
+        "multiplier": 1.3,
+        "description": "Custom amplification"
+    },
+    {"conditions": {"socioeconomic_level": 3}, "multiplier": 0.7, "description": "Exact match"},
+    {"conditions": {"crime_index": "=7", "accident_rate": ">x"}, "multiplier": 2.0, "description": "Malformed"},
+]
+
+
+def _make_records(count, seed, pool_size=None):
+    """Build random valid records, drawn from a small pool if pool_size is set."""
+    rng = random.Random(seed)
+    weather = list(WEATHER_CATEGORIES)
+    
+    def make_record():
+        record = {
+            "crime_index": rng.choice([0, 7, 10, rng.randint(0, 10), round(rng.uniform(0, 10), 2)]),
+            "accident_rate": rng.choice([0.0, round(rng.uniform(0, 10), 1)]),
+            "socioeconomic_level": rng.randint(1, 10),
+            "weather": rng.choice(weather),
+        }
+        if rng.random() < 0.5:
+            record["city"] = rng.choice(["Paris", "Oslo"])
+        return record
+    
+    if pool_size is None:
+        return [make_record() for _ in range(count)]
+    pool = [make_record() for _ in range(pool_size)]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def _expected_scores(processor, records):
+    """Score records one by one with process_risk_data."""
+    results = [processor.process_risk_data(record) for record in records]
+    return {key: np.array([result[key] for result in results]) for key in RESULT_KEYS}
+
+
+def _assert_same_scores(actual, expected):
+    assert sorted(actual) == sorted(RESULT_KEYS)
+    for key in RESULT_KEYS:
+        np.testing.assert_array_equal(actual[key], expected[key], err_msg=key)
+
+
+@pytest.fixture(params=["numpy", "serial", "prange"])
+def scoring_path(request, monkeypatch):
+    """Force one scoring path and record which kernel actually ran."""
+    calls = []
+    if request.param == "numpy":
+        monkeypatch.setattr(risk_processor, "NUMBA_AVAILABLE", False)
+        return calls
+    
+    if not risk_kernel.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    
+    kernel_name = "compute_scores_kernel_serial" if request.param == "serial" else "compute_scores_kernel"
+    kernel = getattr(risk_kernel, kernel_name)
+    
+    def recording_kernel(*args):
+        calls.append(request.param)
+        return kernel(*args)
+    
+    monkeypatch.setattr(risk_kernel, kernel_name, recording_kernel)
+    threshold = 10 ** 9 if request.param == "serial" else 0
+    monkeypatch.setattr(risk_kernel, "PARALLEL_KERNEL_MIN_RECORDS", threshold)
+    return calls
+
+
+@pytest.mark.parametrize("rules", [None, CUSTOM_RULES], ids=["default_rules", "custom_rules"])
+def test_batch_matches_process_risk_data(scoring_path, rules):
+    processor = RiskProcessor(amplification_rules=rules, noise_level=0.0)
+    records = _make_records(3000, seed=1)
+    
+    _assert_same_scores(processor.process_risk_batch(records), _expected_scores(processor, records))
+    if risk_processor.NUMBA_AVAILABLE:
+        assert scoring_path
+
+
+def test_batch_duplicate_grouping_matches_process_risk_data(scoring_path):
+    processor = RiskProcessor(noise_level=0.0)
+    records = _make_records(3000, seed=2, pool_size=40)
+    
+    columns = {
+        field: np.array([float(record[field]) for record in records])
+        for field in ("crime_index", "accident_rate", "socioeconomic_level")
+    }
+    weather_idx = pd.Categorical(
+        [record["weather"] for record in records], categories=list(WEATHER_CATEGORIES)
+    ).codes.astype(np.int64)
+    assert processor._group_duplicate_records(columns, weather_idx) is not None
+    
+    _assert_same_scores(processor.process_risk_batch(records), _expected_scores(processor, records))
+
+
+@pytest.mark.parametrize("categorical", [False, True], ids=["strings", "categorical"])
+def test_arrays_match_process_risk_data(scoring_path, categorical):
+    processor = RiskProcessor(amplification_rules=CUSTOM_RULES, noise_level=0.0)
+    records = _make_records(2000, seed=3)
+    
+    weather = [record["weather"] for record in records]
+    if categorical:
+        weather = pd.Categorical(weather, categories=list(WEATHER_CATEGORIES))
+    result = processor.process_risk_arrays(
+        np.array([float(record["crime_index"]) for record in records]),
+        np.array([float(record["accident_rate"]) for record in records]),
+        np.array([float(record["socioeconomic_level"]) for record in records]),
+        weather
+    )
+    
+    _assert_same_scores(result, _expected_scores(processor, records))
+
+
+def test_crime_component_sweep(scoring_path):
+    processor = RiskProcessor(noise_level=0.0)
+    crimes = np.linspace(0, 10, 1001)
+    records = [
+        {"crime_index": float(crime), "accident_rate": 5.0, "socioeconomic_level": 5, "weather": "Clear"}
+        for crime in crimes
+    ]
+    
+    result = processor.process_risk_batch(records)
+    
+    np.testing.assert_allclose(result["crime_index_component"], crimes * 10.0, atol=1e-9)
+
+
+def test_stream_matches_process_risk_data():
+    processor = RiskProcessor(noise_level=0.0)
+    records = _make_records(1000, seed=4)
+    
+    chunks = list(processor.process_risk_stream(iter(records), chunk_size=64))
+    
+    assert [len(chunk["risk_score"]) for chunk in chunks] == [64] * 15 + [40]
+    streamed = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in RESULT_KEYS}
+    _assert_same_scores(streamed, _expected_scores(processor, records))
+
+
+def test_stream_reports_position_in_stream():
+    processor = RiskProcessor(noise_level=0.0)
+    records = _make_records(200, seed=5)
+    records[130] = dict(records[130], crime_index=50)
+    
+    with pytest.raises(ValidationError, match=r"^Record 130: crime_index must be between 0 and 10"):
+        list(processor.process_risk_stream(records, chunk_size=64))
+
+
+def test_unknown_weather_is_rejected(scoring_path):
+    processor = RiskProcessor(noise_level=0.0)
+    records = _make_records(10, seed=6)
+    records[3] = dict(records[3], weather="Foggy")
+    
+    with pytest.raises(ValidationError, match=r"^Unknown weather: Foggy$"):
+        processor.process_risk_data(records[3])
+    with pytest.raises(ValidationError, match=r"^Record 3: Unknown weather: Foggy$"):
+        processor.process_risk_batch(records)
+    with pytest.raises(ValueError, match=r"^Unknown weather: Foggy$"):
+        processor.process_risk_arrays(
+            np.full(2, 5.0), np.full(2, 5.0), np.full(2, 5.0), np.array(["Rainy", "Foggy"], dtype=object)
+        )
+
+
+def test_parallel_kernel_in_use_falls_back_to_serial(monkeypatch):
+    if not risk_kernel.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    calls = []
+    for name in ("compute_scores_kernel", "compute_scores_kernel_serial"):
+        def recording_kernel(*args, name=name, kernel=getattr(risk_kernel, name)):
+            calls.append(name)
+            return kernel(*args)
+        monkeypatch.setattr(risk_kernel, name, recording_kernel)
+    monkeypatch.setattr(risk_kernel, "PARALLEL_KERNEL_MIN_RECORDS", 0)
+    processor = RiskProcessor(noise_level=0.0)
+    records = _make_records(500, seed=7)
+    
+    with risk_kernel._parallel_kernel_lock:
+        held = processor.process_risk_batch(records)
+    released = processor.process_risk_batch(records)
+    
+    assert calls == ["compute_scores_kernel_serial", "compute_scores_kernel"]
+    expected = _expected_scores(processor, records)
+    _assert_same_scores(held, expected)
+    _assert_same_scores(released, expected)
+
+
+def test_concurrent_parallel_batches_do_not_abort():
+    if not risk_kernel.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    # The workqueue layer terminates the process on concurrent parallel launches
+    script = textwrap.dedent("""
+        import threading
+        import numpy as np
+        import src.core._risk_kernel as risk_kernel
+        from src.core.risk_processor import RiskProcessor
+
+        risk_kernel.PARALLEL_KERNEL_MIN_RECORDS = 0
+        processor = RiskProcessor(noise_level=0.0)
+        rng = np.random.default_rng(0)
+        arrays = (rng.uniform(0, 10, 50000), rng.uniform(0, 10, 50000), rng.uniform(1, 10, 50000),
+                  rng.choice(["Clear", "Rainy"], 50000))
+
+        def score():
+            for _ in range(10):
+                processor.process_risk_arrays(*arrays)
+
+        threads = [threading.Thread(target=score) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    """)
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue", NUMBA_NUM_THREADS="4")
+    
+    completed = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, env=env,
+                               capture_output=True, text=True, timeout=300)
+    
+    assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,144 @@
+"""
+Tests for CSVProcessor parsing and row processing.
+
+The Arrow reader, the vectorized row path and the chunked stream are
+optimizations of the pandas parser and the per-row fallback; their output
+must not depend on which of them handled a file.
+"""
+
+import random
+from io import StringIO
+
+import pandas as pd
+import pytest
+
+from src.core.risk_processor import RiskProcessor
+from src.services import csv_processor
+from src.services.csv_processor import CSVProcessor
+
+HEADER = "city,crime_index,accident_rate,socioeconomic_level,weather\n"
+
+# Cells whose type pandas and Arrow infer differently by default
+DIVERGENT_TOKEN_FILES = {
+    "bool_tokens": "A,1,2,3,Clear\nB,0,2,3,Rainy\nC,true,2,3,Clear\nD,FALSE,True,3,Snowy\n",
+    "plus_sign": "A,+5,2,3,Clear\nB,4,+0.5,3,Rainy\nC,\"+7\",2,3,Clear\n",
+    "big_integers": (
+        "A,1,99999999999999999999,3,Clear\nB,2,18446744073709551615,3,Rainy\n"
+        "C,3,9223372036854775808,3,Clear\n"
+    ),
+    "exponents": "A,1e+0,2.5e-1,3,Clear\nB,5,1E+1,3,Rainy\n",
+    "missing_cells": "A,1,2,3,\n,4,2,3,Rainy\nC,,2,3,Clear\n",
+}
+
+# Numeric-looking text cells confined to the last rows, so chunks differ in what they hold
+TRAILING_NUMERIC_TEXT = (
+    "".join(f"City{i},{i % 10},2.5,{i % 9 + 1},{weather}\n"
+            for i, weather in enumerate(["Clear", "Rainy", "Snowy", "Stormy", "Extreme"] * 3))
+    + "5,1,2,3,Clear\n6,1,2,3,5\n7,4,2,3,Rainy\n8,2,2,3,7\n9,3,2,3,Snowy\n"
+)
+
+
+# Cell tokens per column, valid and malformed, for randomized CSV files
+NUMERIC_TOKENS = ["1", "10", "5", "2.5", "3", "0", "-0", "+5", "1e1", " 7 ", "11", "-1", "abc", "", "nan",
+                  "inf", "true", "99999999999999999999", "0x10", "1_000"]
+WEATHER_TOKENS = ["Clear", "Rainy", "Snowy", "Stormy", "Extreme", " Rainy ", "Foggy", "clear", "", "   ", "5"]
+CITY_TOKENS = ["Paris", " Oslo ", "", "   ", "12", "x" * 101, '"New York, NY"']
+
+
+def _random_csv(seed, row_count=300):
+    """Build CSV text mixing valid and malformed cells."""
+    rng = random.Random(seed)
+    rows = [HEADER.rstrip("\n")]
+    for _ in range(row_count):
+        numeric = [rng.choice(NUMERIC_TOKENS[:5]) if rng.random() < 0.7 else rng.choice(NUMERIC_TOKENS)
+                   for _ in range(3)]
+        weather = rng.choice(WEATHER_TOKENS[:5]) if rng.random() < 0.7 else rng.choice(WEATHER_TOKENS)
+        rows.append(",".join([rng.choice(CITY_TOKENS), *numeric, weather]))
+    return "\n".join(rows) + "\n"
+
+
+@pytest.fixture
+def processor():
+    return CSVProcessor(RiskProcessor(noise_level=0.0))
+
+
+def _assert_vectorized_matches_fallback(processor, df):
+    assert processor._can_process_vectorized()
+    pd.testing.assert_frame_equal(
+        processor._process_rows_vectorized(df, "random.csv"),
+        processor._process_parallel_fallback(df, "random.csv")
+    )
+
+
+@pytest.mark.parametrize("rows", DIVERGENT_TOKEN_FILES.values(), ids=DIVERGENT_TOKEN_FILES.keys())
+def test_parsed_frame_matches_pandas(processor, rows):
+    content = HEADER + rows
+
+    parsed = processor._parse_csv_content(content, "tokens.csv")
+
+    pd.testing.assert_frame_equal(
+        parsed, pd.read_csv(StringIO(content), dtype=csv_processor._CSV_TEXT_DTYPES, on_bad_lines='skip')
+    )
+
+
+@pytest.mark.skipif(csv_processor.pa_csv is None, reason="pyarrow is not installed")
+def test_arrow_reader_keeps_pandas_bool_tokens(processor):
+    content = HEADER + DIVERGENT_TOKEN_FILES["bool_tokens"]
+
+    parsed = processor._read_csv_arrow(content, "tokens.csv")
+
+    assert parsed is not None
+    pd.testing.assert_frame_equal(parsed, pd.read_csv(StringIO(content), dtype=csv_processor._CSV_TEXT_DTYPES))
+
+
+def test_numeric_looking_bool_column_is_not_scored(processor):
+    result = processor.process_csv_file(HEADER + DIVERGENT_TOKEN_FILES["bool_tokens"], "tokens.csv")
+
+    assert list(result["crime_index"]) == ["1", "0", "true", "FALSE"]
+    assert list(result["processing_status"]) == ["SUCCESS", "SUCCESS", "ERROR", "ERROR"]
+    assert result["error_message"].iloc[2] == "crime_index must be a number, got str"
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_vectorized_rows_match_per_row_fallback(processor, seed):
+    processor.chunk_size = 64
+    df = processor._parse_csv_content(_random_csv(seed), "random.csv")
+
+    _assert_vectorized_matches_fallback(processor, df)
+
+
+@pytest.mark.parametrize("seed", range(2))
+def test_vectorized_rows_match_per_row_fallback_with_pandas_parser(processor, seed):
+    df = pd.read_csv(StringIO(_random_csv(seed)), on_bad_lines='skip')
+
+    _assert_vectorized_matches_fallback(processor, df)
+
+
+def test_vectorized_rows_use_processor_validator(processor):
+    processor.risk_processor.validator.crime_range = (0, 20)
+    content = HEADER + "A,15,2,3,Clear\nB,25,2,3,Rainy\n"
+    df = pd.read_csv(StringIO(content))
+
+    result = processor.process_csv_file(content, "ranges.csv")
+
+    assert list(result["processing_status"]) == ["SUCCESS", "ERROR"]
+    assert result["error_message"].iloc[1] == "crime_index must be between 0 and 20, got 25.0"
+    _assert_vectorized_matches_fallback(processor, df)
+
+
+@pytest.mark.parametrize("content", [HEADER + TRAILING_NUMERIC_TEXT, _random_csv(0)], ids=["trailing", "random"])
+@pytest.mark.parametrize("chunksize", [1, 5, 7, 64])
+def test_stream_matches_whole_file(processor, content, chunksize):
+    expected = processor.process_csv_file(content, "stream.csv")
+
+    result = processor.process_csv_stream(StringIO(content), "stream.csv", chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_numeric_looking_text_columns_are_strings(processor):
+    result = processor.process_csv_file(HEADER + "5,1,2,3,Clear\n6,1,2,3,7\n", "numeric.csv")
+
+    assert list(result["city"]) == ["5", "6"]
+    assert list(result["processing_status"]) == ["SUCCESS", "ERROR"]
+    assert result["error_message"].iloc[1] == "Unknown weather: 7"
@@ -0,0 +1,70 @@
+"""
+Tests for RiskProcessor configuration handling.
+
+Per-record scoring caches compiled rule conditions; it must keep following
+the processor's configuration, including in-place edits, the way the batch
+paths, which read it directly, do. A processor must also stay copyable.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from src.config.constants import DEFAULT_RULES
+from src.core.risk_processor import RiskProcessor
+
+RECORD = {"crime_index": 8.5, "accident_rate": 8, "socioeconomic_level": 2, "weather": "Stormy"}
+
+
+@pytest.fixture
+def processor():
+    return RiskProcessor(amplification_rules=copy.deepcopy(DEFAULT_RULES), noise_level=0.0)
+
+
+def _scores(processor):
+    """Score RECORD through process_risk_data and process_risk_batch."""
+    return processor.process_risk_data(RECORD)["risk_score"], processor.process_risk_batch([RECORD])["risk_score"][0]
+
+
+def test_rule_conditions_edited_in_place_are_honoured(processor):
+    single, batch = _scores(processor)
+    assert single == batch
+
+    processor.rules[0]["conditions"]["crime_index"] = ">9"
+    edited_single, edited_batch = _scores(processor)
+
+    assert edited_single == edited_batch
+    assert edited_single < single
+
+
+def test_rule_members_edited_in_place_are_honoured(processor):
+    processor.process_risk_data(RECORD)
+
+    processor.rules[0]["conditions"]["weather"].discard("Stormy")
+    single, batch = _scores(processor)
+
+    assert single == batch
+    assert single == RiskProcessor(amplification_rules=copy.deepcopy(processor.rules),
+                                   noise_level=0.0).process_risk_data(RECORD)["risk_score"]
+
+
+def test_weights_edited_in_place_are_honoured(processor):
+    single, _ = _scores(processor)
+
+    processor.weights["crime_index"] = 0.1
+    edited_single, edited_batch = _scores(processor)
+
+    assert edited_single == edited_batch
+    assert edited_single < single
+
+
+@pytest.mark.parametrize("clone", [copy.deepcopy, lambda p: pickle.loads(pickle.dumps(p))],
+                         ids=["deepcopy", "pickle"])
+def test_used_processor_can_be_copied(processor, clone):
+    single, batch = _scores(processor)
+
+    copied = clone(processor)
+
+    assert isinstance(copied.weights, dict)
+    assert _scores(copied) == (single, batch)